@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     MATTERMOST_URL: Optional[str] = os.getenv("MATTERMOST_URL", "http://localhost:8065")
     MATTERMOST_BOT_TOKEN: Optional[str] = os.getenv("MATTERMOST_BOT_TOKEN")
     MATTERMOST_TEAM_ID: Optional[str] = os.getenv("MATTERMOST_TEAM_ID") # 필요시 팀 ID 추가
+    MATTERMOST_VERIFY_SSL: bool = True # 자체 서명 인증서를 쓰는 개발 서버에서만 False로 설정
+    MATTERMOST_CA_BUNDLE: Optional[str] = None # 사설 CA 인증서 번들 경로 (없으면 시스템 CA 사용)
+    MATTERMOST_SEND_CONCURRENCY: int = 8 # 회의록 일괄 전송 시 최대 동시 전송 수
 
     # Database Configuration
     DB_TYPE: str
@@ -33,6 +36,9 @@ class Settings(BaseSettings):
     # 외부 RAG 서비스 URL
     EXTERNAL_RAG_SERVICE_URL: Optional[str] = os.getenv("EXTERNAL_RAG_SERVICE_URL", "https://team5opensearch.ap.loclx.io ") # 기본 URL 업데이트
 
+    # 시각화 설정
+    VISUALIZATION_RENDER_WORKERS: int = 2 # 차트 렌더링 프로세스 수 (0이면 요청 처리 중 직접 렌더링, 디버깅용)
+
     # 애플리케이션 디버깅 설정
     DEBUG: bool = True
 
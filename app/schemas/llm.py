@@ -26,6 +26,11 @@ class RetrievedDocument(BaseModel):
     score: float = Field(..., description="Relevance score of the document")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Document metadata")
 
+    class Config:
+        """Pydantic config"""
+        # Retrieved documents are shared across cached results, so they must not be mutated
+        frozen = True
+
 class LLMResponse(BaseSchema):
     """Schema for LLM response"""
     response_text: str = Field(..., description="Response text from LLM")
@@ -3,25 +3,83 @@ Mattermost 코어 모듈
 Mattermost API와의 기본 연결 설정 및 클라이언트 생성을 담당합니다.
 """
 import os
-import json
-import traceback
 import logging
 import socket
+import ssl
+import threading
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+import orjson
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.exceptions import RequestException
+import urllib3
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 from mattermostdriver import Driver
 from app.core.config import settings
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # DEBUG 레벨로 설정
 
 # Mattermost 설정 정보
 MATTERMOST_URL = settings.MATTERMOST_URL
 MATTERMOST_TOKEN = settings.MATTERMOST_BOT_TOKEN
+MATTERMOST_VERIFY_SSL = settings.MATTERMOST_VERIFY_SSL
+MATTERMOST_CA_BUNDLE = settings.MATTERMOST_CA_BUNDLE
+
+# requests/mattermostdriver에 전달할 verify 값 (사설 CA 번들 경로, True 또는 False)
+REQUESTS_VERIFY = (MATTERMOST_CA_BUNDLE or True) if MATTERMOST_VERIFY_SSL else False
+
+# HTTP 연결 풀 설정 (keep-alive 연결 재사용)
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 32
+
+# HTTP 타임아웃 (연결, 읽기) 초
+HTTP_TIMEOUT = (3, 15)
+CONNECTION_TEST_TIMEOUT = (3, 5)
+
+# GET 요청 재시도 정책: 일시적 오류(연결/읽기 실패, 429/5xx)에 지수 백오프 + 지터
+HTTP_RETRY = Retry(
+    total=4,
+    connect=3,
+    read=3,
+    status=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False  # 재시도 소진 시 마지막 응답을 그대로 반환 (상태 코드 검사 유지)
+)
+
+# POST 요청 재시도 정책: 서버가 요청을 처리하지 않았음이 확실한 경우만 재시도
+# - 읽기 타임아웃은 서버가 이미 처리했을 수 있으므로 재시도하지 않음 (DM/업로드 중복 방지)
+# - 연결 실패와 429/503(처리 거절) 응답만 재시도
+HTTP_POST_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 503],
+    allowed_methods=frozenset(["POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# 스트리밍 본문(MultipartEncoder 등) 요청은 본문을 되감을 수 없으므로 어댑터에서 재시도하지 않음
+# (재시도가 필요하면 호출 측에서 본문을 새로 만들어 다시 보냄)
+HTTP_NO_RETRY = Retry(total=0, raise_on_status=False)
+
+# DNS 조회 결과 캐시 유지 시간 (초)
+DNS_CACHE_TTL = 300
 
 # URL 파싱 및 연결 설정
+@functools.lru_cache(maxsize=1)
 def parse_mattermost_url():
     """Mattermost URL을 파싱하여 연결 정보를 추출합니다."""
     try:
@@ -33,7 +91,7 @@ def parse_mattermost_url():
         # 도메인이 비어있는지 확인 (스키마만 있는 경우 등)
         if not netloc and parsed_url.path:
             netloc = parsed_url.path  # path에 도메인이 들어간 경우
-            logger.info(f"Using path as netloc: {netloc}")
+            logger.info("Using path as netloc: %s", netloc)
         
         # 포트가 있는지 확인
         if ':' in netloc:
@@ -50,16 +108,102 @@ def parse_mattermost_url():
             'base_url': f"{scheme}://{hostname}:{port}"
         }
     except Exception as e:
-        logger.error(f"Mattermost URL 파싱 오류: {e}")
+        logger.error("Mattermost URL 파싱 오류: %s", e)
         return None
 
+# DNS 조회 캐시 (Mattermost 호스트 한정)
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """Mattermost 호스트에 대한 getaddrinfo 결과를 TTL 동안 캐시합니다."""
+    connection_info = parse_mattermost_url()
+    if not connection_info or host != connection_info['hostname']:
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+    
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+def install_dns_cache():
+    """
+    프로세스 전역 socket.getaddrinfo를 캐시 래퍼로 교체합니다.
+    
+    모든 라이브러리의 이름 조회에 영향을 주므로 임포트 시 자동으로 설치하지 않고,
+    애플리케이션 시작 훅에서 명시적으로 호출합니다. (Mattermost 호스트 외의 조회는 그대로 통과)
+    """
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+
 # 연결 테스트 함수
-def test_mattermost_connection():
-    """Mattermost 서버 연결 및 인증을 테스트합니다."""
+def test_mattermost_connection(verbose: bool = False):
+    """
+    Mattermost 서버 연결 및 인증을 테스트합니다.
+    
+    기본적으로 인증된 GET /users/me 한 번으로 DNS, 연결, TLS, 토큰을 함께 확인합니다.
+    
+    Args:
+        verbose (bool): True이면 DNS -> 서버 연결 -> 토큰 순서로 단계별 진단을 수행
+    """
     connection_info = parse_mattermost_url()
     if not connection_info:
         return {"success": False, "message": "URL 파싱 실패"}
     
+    if not MATTERMOST_TOKEN:
+        return {"success": False, "message": "봇 토큰이 설정되지 않았습니다."}
+    
+    if verbose:
+        return _test_mattermost_connection_verbose(connection_info)
+    
+    test_results = {
+        "dns_resolution": {"success": False, "message": ""},
+        "server_connection": {"success": False, "message": ""},
+        "api_token": {"success": False, "message": ""},
+        "overall": {"success": False, "message": ""}
+    }
+    
+    try:
+        auth_test_url = f"{connection_info['base_url']}/api/v4/users/me"
+        logger.info("Testing Mattermost connection: %s", auth_test_url)
+        response = api_session["session"].get(auth_test_url, timeout=CONNECTION_TEST_TIMEOUT)
+    except RequestException as e:
+        # DNS/연결/TLS 실패는 모두 요청 예외로 나타남
+        error_msg = f"Server connection test failed: {e}"
+        logger.error(error_msg)
+        test_results["server_connection"] = {"success": False, "message": error_msg}
+        test_results["overall"] = {"success": False, "message": "Server connection failed"}
+        return test_results
+    
+    # 응답을 받았다면 DNS 해석과 서버 연결은 성공
+    test_results["dns_resolution"] = {"success": True, "message": f"DNS resolution successful for: {connection_info['hostname']}"}
+    test_results["server_connection"] = {"success": True, "message": f"Server response: {response.status_code}"}
+    
+    if response.status_code == 200:
+        user_data = parse_json_response(response)
+        test_results["api_token"] = {
+            "success": True,
+            "message": f"Successfully authenticated as: {user_data.get('username', 'Unknown')}"
+        }
+        test_results["overall"] = {"success": True, "message": "All Mattermost connection tests passed"}
+    else:
+        error_msg = f"API token test failed: HTTP {response.status_code}"
+        logger.error(error_msg)
+        test_results["api_token"] = {"success": False, "message": error_msg}
+        test_results["overall"] = {"success": False, "message": "API token authentication failed"}
+    
+    return test_results
+
+def _test_mattermost_connection_verbose(connection_info):
+    """DNS 해석, 서버 연결, API 토큰을 단계별로 테스트합니다 (운영 진단용)."""
     hostname = connection_info['hostname']
     scheme = connection_info['scheme']
     port = connection_info['port']
@@ -74,8 +218,9 @@ def test_mattermost_connection():
     
     # 1. DNS 해석 테스트
     try:
-        logger.info(f"Testing DNS resolution for: {hostname}")
-        socket.gethostbyname(hostname)
+        logger.info("Testing DNS resolution for: %s", hostname)
+        # urllib3와 같은 인자로 조회해 결과가 DNS 캐시에 남아 이후 요청이 재사용하도록 함
+        socket.getaddrinfo(hostname, port, 0, socket.SOCK_STREAM)
         test_results["dns_resolution"] = {"success": True, "message": f"DNS resolution successful for: {hostname}"}
     except socket.gaierror as e:
         error_msg = f"DNS resolution failed for {hostname}: {e}"
@@ -87,8 +232,8 @@ def test_mattermost_connection():
     # 2. 서버 연결 테스트
     try:
         test_url = f"{base_url}/api/v4/system/ping"
-        logger.info(f"Testing server connection: {test_url}")
-        response = requests.get(test_url, verify=False, timeout=5)
+        logger.info("Testing server connection: %s", test_url)
+        response = api_session["session"].get(test_url, timeout=HTTP_TIMEOUT)
         test_results["server_connection"] = {
             "success": response.status_code < 400,
             "message": f"Server response: {response.status_code} - {response.text[:100]}"
@@ -106,12 +251,11 @@ def test_mattermost_connection():
     # 3. API 토큰 테스트
     try:
         auth_test_url = f"{base_url}/api/v4/users/me"
-        headers = {"Authorization": f"Bearer {MATTERMOST_TOKEN}"}
-        logger.info(f"Testing API token with direct request...")
-        auth_response = requests.get(auth_test_url, headers=headers, verify=False, timeout=5)
+        logger.info("Testing API token with direct request...")
+        auth_response = api_session["session"].get(auth_test_url, timeout=HTTP_TIMEOUT)
         
         if auth_response.status_code == 200:
-            user_data = auth_response.json()
+            user_data = parse_json_response(auth_response)
             test_results["api_token"] = {
                 "success": True,
                 "message": f"Successfully authenticated as: {user_data.get('username', 'Unknown')}"
@@ -156,12 +300,15 @@ def initialize_mattermost_client():
         'token': MATTERMOST_TOKEN,
         'scheme': scheme,
         'port': port,
-        'verify': False,  # 개발 환경에서는 SSL 검증 비활성화
+        'verify': REQUESTS_VERIFY,
         'timeout': 30  # 타임아웃 값 증가
     }
     
-    logger.info(f"Initializing Mattermost driver with: {scheme}://{hostname}:{port}")
-    logger.debug(f"Mattermost Driver 옵션: url={hostname}, scheme={scheme}, port={port}, token_length={len(MATTERMOST_TOKEN) if MATTERMOST_TOKEN else 0}, verify=False")
+    logger.info("Initializing Mattermost driver with: %s://%s:%s", scheme, hostname, port)
+    logger.debug(
+        "Mattermost Driver 옵션: url=%s, scheme=%s, port=%s, token_length=%d, verify=%s",
+        hostname, scheme, port, len(MATTERMOST_TOKEN), REQUESTS_VERIFY
+    )
     
     try:
         client = Driver(options=driver_options)
@@ -172,37 +319,207 @@ def initialize_mattermost_client():
         # 추가 정보 확인
         try:
             me_info = client.users.get_user('me')
-            logger.debug(f"Mattermost 로그인 사용자 정보: id={me_info.get('id')}, username={me_info.get('username')}")
+            logger.debug("Mattermost 로그인 사용자 정보: id=%s, username=%s", me_info.get('id'), me_info.get('username'))
         except Exception as user_info_err:
-            logger.warning(f"로그인 사용자 정보 조회 실패: {user_info_err}")
+            logger.warning("로그인 사용자 정보 조회 실패: %s", user_info_err)
         
         return client
     except Exception as e:
-        logger.error(f"Mattermost driver login failed: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Mattermost driver login failed: %s", e)
         return None
 
-# 초기화 시도
-mattermost_client = initialize_mattermost_client()
+# 초기화 실패 후 재연결을 시도하기까지 대기 시간 (초)
+RECONNECT_INTERVAL = 60
+
+class _LazyProxy:
+    """
+    최초 사용 시점에 초기화되는 스레드 안전 지연 객체.
+    
+    모듈 임포트 시 네트워크 호출(로그인 등)을 하지 않고, 처음 접근할 때 이중 확인 잠금으로
+    한 번만 초기화합니다. 초기화에 실패하면 RECONNECT_INTERVAL 이후 다시 시도합니다.
+    """
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value = None
+        self._initialized = False
+        self._next_retry = 0.0
+    
+    def get(self):
+        """초기화된 실제 객체를 반환합니다. 초기화 실패 시 None을 반환합니다."""
+        if self._initialized:
+            return self._value
+        
+        with self._lock:
+            if not self._initialized and time.monotonic() >= self._next_retry:
+                value = self._factory()
+                if value is not None:
+                    self._value = value
+                    self._initialized = True
+                else:
+                    self._next_retry = time.monotonic() + RECONNECT_INTERVAL
+        return self._value
+    
+    def reset(self):
+        """초기화 상태를 지워 다음 접근 시 다시 초기화하도록 합니다."""
+        with self._lock:
+            self._value = None
+            self._initialized = False
+            self._next_retry = 0.0
+    
+    def __bool__(self):
+        return self.get() is not None
+    
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+    
+    def __getitem__(self, key):
+        return self.get()[key]
+
+# 최초 사용 시 초기화
+mattermost_client = _LazyProxy(initialize_mattermost_client)
+
+# JSON 직렬화/역직렬화 (orjson 사용)
+def parse_json_response(response):
+    """HTTP 응답 본문을 orjson으로 디코딩합니다."""
+    return orjson.loads(response.content)
+
+class MattermostSession(requests.Session):
+    """json= 인자를 orjson으로 직렬화하는 requests 세션"""
+    
+    def request(self, method, url, **kwargs):
+        payload = kwargs.pop("json", None)
+        if payload is not None and kwargs.get("data") is None:
+            kwargs["data"] = orjson.dumps(payload)
+        return super().request(method, url, **kwargs)
+
+# 세션의 모든 어댑터가 공유하는 SSL 컨텍스트 (API 세션 생성 시 한 번 생성)
+def create_ssl_context():
+    """
+    Mattermost 연결에 공유할 SSL 컨텍스트를 생성합니다.
+    TLS 세션 티켓을 허용해 재연결 시 핸드셰이크를 단축합니다.
+    인증서는 시스템 CA(또는 MATTERMOST_CA_BUNDLE)로 검증하며,
+    MATTERMOST_VERIFY_SSL=False인 경우에만 검증을 끕니다.
+    """
+    context = ssl.create_default_context(cafile=MATTERMOST_CA_BUNDLE)
+    if not MATTERMOST_VERIFY_SSL:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    context.options &= ~ssl.OP_NO_TICKET
+    context.set_alpn_protocols(['http/1.1'])
+    return context
+
+# 검증을 명시적으로 끈 경우에만 요청마다 발생하는 경고를 끔
+if not MATTERMOST_VERIFY_SSL:
+    urllib3.disable_warnings(InsecureRequestWarning)
+
+class SSLContextAdapter(HTTPAdapter):
+    """미리 생성한 SSL 컨텍스트로 연결 풀을 만드는 HTTPAdapter"""
+    
+    def __init__(self, ssl_context, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+class MethodRoutingAdapter(BaseAdapter):
+    """
+    요청 메서드와 본문 형태에 따라 재시도 정책이 다른 어댑터로 요청을 보내는 어댑터
+    
+    - GET/HEAD: HTTP_RETRY (읽기/상태 재시도 허용)
+    - 그 외 메서드(bytes/str 본문): HTTP_POST_RETRY (연결 실패, 429/503만 재시도)
+    - 스트리밍 본문: HTTP_NO_RETRY (소비된 본문을 다시 보내지 않음)
+    """
+    
+    def __init__(self, read_adapter, write_adapter, stream_adapter):
+        super().__init__()
+        self._read_adapter = read_adapter
+        self._write_adapter = write_adapter
+        self._stream_adapter = stream_adapter
+    
+    def send(self, request, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            adapter = self._read_adapter
+        elif request.body is None or isinstance(request.body, (bytes, str)):
+            adapter = self._write_adapter
+        else:
+            adapter = self._stream_adapter
+        return adapter.send(request, **kwargs)
+    
+    def close(self):
+        self._read_adapter.close()
+        self._write_adapter.close()
+        self._stream_adapter.close()
+
+def _create_pooled_adapter(ssl_context, max_retries):
+    """공유 SSL 컨텍스트와 연결 풀 설정을 적용한 어댑터를 생성합니다."""
+    return SSLContextAdapter(
+        ssl_context,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=True,
+        max_retries=max_retries
+    )
 
 # 기본 세션 객체 (직접 API 호출용)
 def create_api_session():
     """직접 API 호출을 위한 세션 객체를 생성합니다."""
+    # 토큰이 없으면 모든 호출이 401로 실패하므로 세션을 만들지 않음 (is_mattermost_ready()가 False가 됨)
+    if not MATTERMOST_TOKEN:
+        logger.error("Mattermost API 세션 생성 실패: 봇 토큰이 설정되지 않았습니다.")
+        return None
+    
     connection_info = parse_mattermost_url()
     if not connection_info:
         return None
     
-    session = requests.Session()
-    session.verify = False
+    session = MattermostSession()
+    session.verify = REQUESTS_VERIFY
+    
+    # 호스트별 연결 풀을 키워 keep-alive 연결을 재사용 (TCP/TLS 핸드셰이크 절감)
+    # 일시적 오류는 어댑터 수준에서 백오프 후 재시도 (메서드별로 안전한 범위만)
+    # CA 인증서 로딩은 임포트 시점이 아닌 세션 생성 시 한 번만 수행
+    ssl_context = create_ssl_context()
+    adapter = MethodRoutingAdapter(
+        read_adapter=_create_pooled_adapter(ssl_context, HTTP_RETRY),
+        write_adapter=_create_pooled_adapter(ssl_context, HTTP_POST_RETRY),
+        stream_adapter=_create_pooled_adapter(ssl_context, HTTP_NO_RETRY)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
     session.headers.update({
         "Authorization": f"Bearer {MATTERMOST_TOKEN}",
-        "Content-Type": "application/json"
+        "Content-Type": "application/json",
+        "Connection": "keep-alive"
     })
     
+    # 요청마다 다시 만들지 않도록 API 경로 접두사를 미리 구성
     return {
         "session": session,
-        "base_url": connection_info['base_url']
+        "base_url": connection_info['base_url'],
+        "api_url": f"{connection_info['base_url']}/api/v4"
     }
 
-# API 세션 생성
-api_session = create_api_session()
+# API 세션 (최초 사용 시 생성)
+api_session = _LazyProxy(create_api_session)
+
+# 비동기 메서드용 Mattermost I/O 스레드 풀 크기
+MATTERMOST_IO_MAX_WORKERS = 8
+
+# 비동기 메서드가 동기 Mattermost 호출을 넘기는 공유 스레드 풀
+# (기본 실행기를 다른 작업과 공유하지 않고 동시에 막히는 스레드 수를 제한, 스레드는 첫 작업 제출 시 생성)
+io_executor = ThreadPoolExecutor(
+    max_workers=MATTERMOST_IO_MAX_WORKERS,
+    thread_name_prefix="mattermost-io"
+)
+
+# Mattermost 연결이 설정되지 않았을 때 서비스가 반환하는 메시지
+NOT_CONFIGURED_MESSAGE = "Mattermost 연결이 설정되지 않았습니다. (URL 또는 봇 토큰 확인 필요)"
+
+def is_mattermost_ready() -> bool:
+    """공유 API 세션을 사용할 수 있는지 확인합니다. (설정 누락 시 예외 없이 False)"""
+    return bool(api_session)
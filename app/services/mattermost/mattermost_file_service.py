@@ -3,36 +3,75 @@ Mattermost 파일 서비스
 Mattermost에 파일을 업로드하고 관리하는 기능을 제공합니다.
 """
 import os
+import io
+import mmap
+import contextlib
 import logging
+import mimetypes
+import time
 from typing import Optional, Dict, Any
-import traceback
-from app.services.mattermost.mattermost_core import mattermost_client, api_session
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from app.services.mattermost.mattermost_core import (
+    api_session, parse_json_response, HTTP_TIMEOUT, NOT_CONFIGURED_MESSAGE, is_mattermost_ready
+)
 
 logger = logging.getLogger(__name__)
 
+# 파일 업로드 재시도 설정 (서버가 요청을 처리하지 않은 429/503 응답만 재시도)
+UPLOAD_MAX_ATTEMPTS = 3
+UPLOAD_RETRY_STATUS_CODES = (429, 503)
+UPLOAD_RETRY_BACKOFF = 0.5
+
 class FileService:
     """Mattermost 파일 업로드 및 관리 기능을 제공하는 클래스"""
     
     def __init__(self):
         """파일 서비스를 초기화합니다."""
-        self.client = mattermost_client
+        # 모든 요청은 튜닝된 공유 세션(연결 풀, 재시도, 스트리밍 업로드)으로 처리
         self.api = api_session
     
-    def upload_file(self, channel_id: str, file_path: str) -> Dict[str, Any]:
+    def read_file_once(self, file_path: str) -> Optional[bytes]:
+        """
+        여러 채널에 반복 업로드할 파일을 한 번만 읽어 메모리에 올립니다.
+        
+        Args:
+            file_path (str): 읽을 로컬 파일 경로
+            
+        Returns:
+            Optional[bytes]: 파일 내용 또는 None (실패 시)
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                return file.read()
+        except OSError as e:
+            logger.error("파일 읽기 실패: %s - %s", file_path, e)
+            return None
+    
+    def upload_file(
+        self,
+        channel_id: str,
+        file_path: str,
+        file_content: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """
         파일을 Mattermost 채널에 업로드합니다.
         
         Args:
             channel_id (str): 파일을 업로드할 채널 ID
             file_path (str): 업로드할 로컬 파일 경로
+            file_content (bytes, optional): 미리 읽어 둔 파일 내용 (제공되면 디스크를 다시 읽지 않음)
             
         Returns:
             Dict[str, Any]: 업로드 결과 및 파일 ID 정보
         """
         result = {"success": False, "message": "", "file_id": None}
         
+        if not is_mattermost_ready():
+            result["message"] = NOT_CONFIGURED_MESSAGE
+            return result
+        
         # 파일 존재 여부 확인
-        if not os.path.exists(file_path):
+        if file_content is None and not os.path.exists(file_path):
             result["message"] = f"파일이 존재하지 않습니다: {file_path}"
             logger.error(result["message"])
             return result
@@ -40,68 +79,96 @@ class FileService:
         try:
             file_name = os.path.basename(file_path)
             
-            if self.client:
-                # mattermostdriver를 사용하는 경우
-                with open(file_path, 'rb') as file:
-                    file_upload_response = self.client.files.upload_file(
-                        channel_id=channel_id,
-                        files={'files': (file_name, file)}
+            # 공유 세션으로 스트리밍 업로드
+            session = self.api["session"]
+            url = self.api["api_url"] + "/files"
+            content_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+            
+            with self._open_file(file_path, file_content) as file:
+                # 스트리밍 본문은 세션 어댑터가 재시도하지 않으므로, 처리 거절(429/503) 시
+                # 파일을 되감고 인코더를 새로 만들어 다시 전송
+                for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+                    file.seek(0)
+                    # MultipartEncoder는 파일을 청크 단위로 소켓에 전송 (전체 파일을 메모리에 올리지 않음)
+                    # 경계값은 요청마다 인코더가 새로 생성
+                    encoder = MultipartEncoder(
+                        fields={
+                            'channel_id': channel_id,
+                            'files': (file_name, file, content_type)
+                        }
                     )
-                
-                file_infos = file_upload_response.get('file_infos', [])
-                if file_infos and len(file_infos) > 0:
-                    file_id = file_infos[0].get('id')
-                    result["success"] = True
-                    result["file_id"] = file_id
-                    result["message"] = f"파일이 성공적으로 업로드되었습니다. 파일 ID: {file_id}"
-                    logger.info(f"File uploaded successfully to channel_id: {channel_id}, file_id: {file_id}")
-                else:
-                    result["message"] = "파일 업로드 응답에서 file_infos를 찾을 수 없습니다."
-                    logger.error(result["message"])
-            else:
-                # 직접 API 호출을 사용하는 경우
-                session = self.api["session"]
-                base_url = self.api["base_url"]
-                url = f"{base_url}/api/v4/files"
-                
-                with open(file_path, 'rb') as file:
-                    # Content-Type 헤더 제거 (multipart/form-data로 자동 설정)
-                    headers = session.headers.copy()
-                    if 'Content-Type' in headers:
-                        del headers['Content-Type']
                     
-                    files = {
-                        'files': (file_name, file),
-                        'channel_id': (None, channel_id)
-                    }
+                    # 세션의 Content-Type(application/json)을 인코더의 multipart 헤더로 덮어씀
+                    response = session.post(
+                        url,
+                        data=encoder,
+                        headers={'Content-Type': encoder.content_type},
+                        timeout=HTTP_TIMEOUT
+                    )
                     
-                    response = session.post(url, headers=headers, files=files)
+                    if response.status_code not in UPLOAD_RETRY_STATUS_CODES or attempt == UPLOAD_MAX_ATTEMPTS:
+                        break
                     
-                    if response.status_code < 400:
-                        file_upload_data = response.json()
-                        file_infos = file_upload_data.get('file_infos', [])
-                        
-                        if file_infos and len(file_infos) > 0:
-                            file_id = file_infos[0].get('id')
-                            result["success"] = True
-                            result["file_id"] = file_id
-                            result["message"] = f"파일이 성공적으로 업로드되었습니다. 파일 ID: {file_id}"
-                            logger.info(f"File uploaded successfully to channel_id: {channel_id}, file_id: {file_id}")
-                        else:
-                            result["message"] = "파일 업로드 응답에서 file_infos를 찾을 수 없습니다."
-                            logger.error(result["message"])
-                    else:
-                        raise Exception(f"파일 업로드 실패: {response.status_code} - {response.text}")
+                    delay = self._retry_delay(response, attempt)
+                    logger.warning(
+                        "파일 업로드가 거절되어 %.1f초 후 재시도합니다: %s (%d/%d)",
+                        delay, response.status_code, attempt, UPLOAD_MAX_ATTEMPTS
+                    )
+                    time.sleep(delay)
                 
+                if response.status_code < 400:
+                    file_upload_data = parse_json_response(response)
+                    file_infos = file_upload_data.get('file_infos', [])
+                    
+                    if file_infos and len(file_infos) > 0:
+                        file_id = file_infos[0].get('id')
+                        result["success"] = True
+                        result["file_id"] = file_id
+                        result["message"] = f"파일이 성공적으로 업로드되었습니다. 파일 ID: {file_id}"
+                        logger.info("File uploaded successfully to channel_id: %s, file_id: %s", channel_id, file_id)
+                    else:
+                        result["message"] = "파일 업로드 응답에서 file_infos를 찾을 수 없습니다."
+                        logger.error(result["message"])
+                else:
+                    result["status_code"] = response.status_code
+                    result["message"] = f"파일 업로드 실패: {response.status_code} - {response.text}"
+                    logger.error(result["message"])
+            
             return result
             
         except Exception as e:
             error_msg = f"파일 업로드 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             result["message"] = error_msg
             return result
     
+    @staticmethod
+    def _retry_delay(response, attempt: int) -> float:
+        """Retry-After 헤더(초)가 있으면 따르고, 없으면 지수 백오프 대기 시간을 반환합니다."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return UPLOAD_RETRY_BACKOFF * (2 ** (attempt - 1))
+    
+    @contextlib.contextmanager
+    def _open_file(self, file_path: str, file_content: Optional[bytes] = None):
+        """
+        업로드용 파일 객체를 엽니다.
+        미리 읽어 둔 내용이 있으면 메모리에서, 없으면 mmap으로 페이지 캐시를 직접 읽습니다.
+        """
+        if file_content is not None:
+            yield io.BytesIO(file_content)
+            return
+        
+        with open(file_path, 'rb') as file:
+            # 빈 파일은 mmap할 수 없으므로 일반 파일 객체 사용
+            if os.fstat(file.fileno()).st_size == 0:
+                yield file
+                return
+            
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+    
     def upload_minutes_file(self, channel_id: str, minutes_pdf_path: str) -> Dict[str, Any]:
         """
         회의록 PDF 파일을 Mattermost 채널에 업로드합니다.
@@ -2,36 +2,82 @@
 Mattermost 관리자 서비스
 Mattermost 관련 모든 서비스를 통합 관리하는 클래스를 제공합니다.
 """
+import asyncio
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any
-from app.services.mattermost.mattermost_message_service import MessageService
+from app.core.config import settings
+from app.services.mattermost.mattermost_core import _LazyProxy, io_executor
+from app.services.mattermost.mattermost_message_service import MessageService, MINUTES_MESSAGE_TEMPLATE
 from app.services.mattermost.mattermost_file_service import FileService
 from app.services.mattermost.mattermost_user_service import UserService
 
 logger = logging.getLogger(__name__)
 
-class MattermostManager:
-    """Mattermost 관련 모든 서비스를 통합 관리하는 클래스"""
+# 회의록 동시 전송 최대 작업자 수 (429 재시도/Retry-After 대기는 공유 세션의 urllib3 Retry가 처리)
+MINUTES_SEND_MAX_WORKERS = max(1, settings.MATTERMOST_SEND_CONCURRENCY)
+
+# 서버 과부하(rate limit) 응답 코드
+HTTP_TOO_MANY_REQUESTS = 429
+
+# 캐시된 DM 채널이 더 이상 유효하지 않을 때 업로드가 받는 응답 코드
+STALE_CHANNEL_STATUS_CODES = (403, 404)
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식으로 동시 전송 수를 조절하는 제한기.
+    
+    429 응답을 받으면 허용 동시성을 절반으로 줄이고(곱셈 감소), 현재 허용치만큼
+    연속 성공할 때마다 1씩 늘립니다(덧셈 증가).
+    """
     
-    _instance = None
+    def __init__(self, initial_limit: int, max_limit: int):
+        self.limit = initial_limit
+        self.max_limit = max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
     
-    def __new__(cls):
-        """싱글톤 패턴 구현"""
-        if cls._instance is None:
-            cls._instance = super(MattermostManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    def acquire(self):
+        """허용 동시성에 여유가 생길 때까지 대기합니다."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+    
+    def release(self, throttled: bool = False):
+        """작업 완료를 기록하고 결과에 따라 허용 동시성을 조정합니다."""
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+                logger.warning("Mattermost rate limit 감지: 동시 전송 수를 %d(으)로 축소", self.limit)
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+class MattermostManager:
+    """Mattermost 관련 모든 서비스를 통합 관리하는 클래스"""
     
     def __init__(self):
-        """Mattermost 서비스를 초기화합니다."""
-        if self._initialized:
-            return
-        
+        """Mattermost 서비스를 초기화합니다. 인스턴스는 get_manager()로 얻습니다."""
         logger.info("MattermostManager 초기화 중...")
         self.message_service = MessageService()
         self.file_service = FileService()
         self.user_service = UserService()
-        self._initialized = True
+        # 비동기 메서드가 동기 Mattermost 호출을 넘기는 공유 스레드 풀 (UserService와 공유)
+        self._io_executor = io_executor
+        # 학습된 동시 전송 수는 인스턴스에 유지되어 다음 전송에 이어서 사용
+        self._send_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=MINUTES_SEND_MAX_WORKERS,
+            max_limit=MINUTES_SEND_MAX_WORKERS
+        )
         logger.info("MattermostManager 초기화 완료")
     
     # 메시지 서비스 기능
@@ -44,6 +90,14 @@ class MattermostManager:
             channel_id=channel_id
         )
     
+    async def send_message_to_user_async(self, user_id, message, file_ids=None, channel_id=None):
+        """사용자에게 메시지 전송 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.send_message_to_user(user_id, message, file_ids=file_ids, channel_id=channel_id)
+        )
+    
     def send_message_to_channel(self, channel_id, message, file_ids=None):
         """채널에 메시지 전송"""
         return self.message_service.send_message_to_channel(
@@ -52,6 +106,14 @@ class MattermostManager:
             file_ids=file_ids
         )
     
+    async def send_message_to_channel_async(self, channel_id, message, file_ids=None):
+        """채널에 메시지 전송 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.send_message_to_channel(channel_id, message, file_ids=file_ids)
+        )
+    
     # 파일 서비스 기능
     def upload_file(self, channel_id, file_path):
         """파일 업로드"""
@@ -60,11 +122,27 @@ class MattermostManager:
             file_path=file_path
         )
     
+    async def upload_file_async(self, channel_id, file_path):
+        """파일 업로드 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.upload_file(channel_id, file_path)
+        )
+    
     # 사용자 서비스 기능
     def find_mattermost_user_id(self, username):
         """사용자 이름으로 ID 찾기"""
         return self.user_service.find_user_id_by_username(username)
     
+    async def find_mattermost_user_id_async(self, username):
+        """사용자 이름으로 ID 찾기 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.find_mattermost_user_id(username)
+        )
+    
     def find_channel_id_by_name(self, channel_name, team_id=None):
         """채널 이름으로 ID 찾기"""
         return self.user_service.find_channel_id_by_name(
@@ -77,15 +155,28 @@ class MattermostManager:
         return self.user_service.list_users()
     
     # 회의록 전송 기능
-    def send_meeting_minutes_to_participants(self, meeting_id, participants, user_message=None, channel_id=None):
+    def send_meeting_minutes_to_participants(
+        self,
+        meeting_id,
+        participants,
+        user_message=None,
+        channel_id=None,
+        minutes_pdf_path=None,
+        meeting_title=None
+    ):
         """
         회의 참여자들에게 회의록을 전송합니다.
         
+        참여자별 전송(DM 채널 조회, 파일 업로드, 메시지 전송)은 제한된 스레드 풀에서 동시에 수행되며,
+        동시 전송 수는 429 응답에 따라 AdaptiveConcurrencyLimiter가 조절합니다.
+        
         Args:
             meeting_id (str): 회의 ID
-            participants (List[Dict]): 참여자 정보 목록
+            participants (List[Dict]): 참여자 정보 목록 (mattermost_user_id 포함)
             user_message (str, optional): 추가 메시지
-            channel_id (str, optional): 특정 채널 ID
+            channel_id (str, optional): 특정 채널 ID (지정 시 해당 채널에만 전송)
+            minutes_pdf_path (str, optional): 회의록 PDF 파일 경로
+            meeting_title (str, optional): 회의 제목 (기본값: 회의 ID)
             
         Returns:
             Dict[str, Any]: 전송 결과 정보
@@ -106,13 +197,155 @@ class MattermostManager:
             logger.warning(results["message"])
             return results
         
-        # 미구현 상태 (실제 회의록 전송 기능 구현 필요)
-        # TODO: 회의록 파일 경로 가져오기, 참여자별 전송 등 구현
-        results["message"] = "회의록 전송 기능이 아직 구현되지 않았습니다."
-        logger.warning(results["message"])
+        if not minutes_pdf_path:
+            results["message"] = "전송할 회의록 파일 경로가 없습니다."
+            logger.warning(results["message"])
+            return results
+        
+        meeting_title = meeting_title or meeting_id
+        details = results["details"]
+        
+        # 모든 수신자에게 같은 메시지를 보내므로 루프 밖에서 한 번만 생성
+        message = self._build_minutes_message(meeting_title, user_message)
+        
+        # 회의록 파일은 한 번만 읽고 모든 업로드에서 같은 내용을 재사용
+        file_content = self.file_service.read_file_once(minutes_pdf_path)
+        if file_content is None:
+            results["message"] = f"회의록 파일을 읽을 수 없습니다: {minutes_pdf_path}"
+            return results
+        
+        # 특정 채널이 지정된 경우 해당 채널에 한 번만 전송
+        if channel_id:
+            file_result = self.file_service.upload_file(
+                channel_id=channel_id,
+                file_path=minutes_pdf_path,
+                file_content=file_content
+            )
+            if not file_result["success"]:
+                results["message"] = f"파일 업로드 실패: {file_result['message']}"
+                return results
+            
+            send_result = self.message_service.send_message_to_channel(
+                channel_id=channel_id,
+                message=message,
+                file_ids=[file_result["file_id"]]
+            )
+            results["success"] = send_result["success"]
+            results["message"] = send_result["message"]
+            return results
+        
+        # 참여자별 DM 전송을 동시에 수행
+        with ThreadPoolExecutor(max_workers=MINUTES_SEND_MAX_WORKERS) as executor:
+            futures = {}
+            for participant in participants:
+                user_id = participant.get("mattermost_user_id")
+                if not user_id:
+                    details["failed_count"] += 1
+                    details["failed_details"].append({
+                        "participant": participant.get("name"),
+                        "reason": "Mattermost 사용자 ID가 없습니다."
+                    })
+                    continue
+                
+                future = executor.submit(
+                    self._send_minutes_with_backpressure,
+                    user_id,
+                    minutes_pdf_path,
+                    meeting_title,
+                    user_message,
+                    file_content,
+                    message
+                )
+                futures[future] = participant
+            
+            for future in as_completed(futures):
+                participant = futures[future]
+                try:
+                    send_result = future.result()
+                except Exception as e:
+                    send_result = {"success": False, "message": str(e)}
+                
+                if send_result["success"]:
+                    details["success_count"] += 1
+                else:
+                    details["failed_count"] += 1
+                    details["failed_details"].append({
+                        "participant": participant.get("name"),
+                        "user_id": participant.get("mattermost_user_id"),
+                        "reason": send_result["message"]
+                    })
+        
+        results["success"] = details["failed_count"] == 0
+        results["message"] = (
+            f"회의록 전송 완료: 성공 {details['success_count']}명, 실패 {details['failed_count']}명"
+        )
+        logger.info("Meeting minutes sent for meeting_id: %s - %s", meeting_id, results['message'])
         return results
     
-    def send_minutes_to_user(self, user_id, minutes_pdf_path, meeting_title):
+    async def send_meeting_minutes_to_participants_async(self, meeting_id, participants, **kwargs):
+        """
+        회의록 일괄 전송의 비동기 버전.
+        
+        참여자별 전송은 send_meeting_minutes_to_participants의 제한된 스레드 풀에서 겹쳐 실행되며,
+        호출한 이벤트 루프는 전송이 끝날 때까지 막히지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.send_meeting_minutes_to_participants(meeting_id, participants, **kwargs)
+        )
+    
+    def _send_minutes_with_backpressure(self, user_id, minutes_pdf_path, meeting_title, user_message=None, file_content=None, message=None):
+        """동시 전송 제한기를 거쳐 회의록을 전송합니다."""
+        self._send_limiter.acquire()
+        send_result = {}
+        try:
+            send_result = self.send_minutes_to_user(
+                user_id,
+                minutes_pdf_path,
+                meeting_title,
+                user_message,
+                file_content,
+                message
+            )
+            return send_result
+        finally:
+            self._send_limiter.release(
+                throttled=send_result.get("status_code") == HTTP_TOO_MANY_REQUESTS
+            )
+    
+    def _build_minutes_message(self, meeting_title, user_message=None):
+        """회의록 공유 메시지를 생성합니다."""
+        message = MINUTES_MESSAGE_TEMPLATE.format(title=meeting_title)
+        if user_message:
+            message += f"\n\n{user_message}"
+        return message
+    
+    async def send_minutes_to_user_async(self, user_id, minutes_pdf_path, meeting_title, user_message=None):
+        """
+        회의록 PDF를 특정 사용자에게 전송하는 비동기 버전.
+        
+        서로 독립적인 DM 채널 확보(네트워크)와 회의록 파일 읽기(디스크)를 동시에 수행한 뒤
+        업로드와 메시지 전송을 스레드 풀에서 이어서 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        channel_id, file_content = await asyncio.gather(
+            loop.run_in_executor(self._io_executor, self.message_service.get_or_create_dm_channel, user_id),
+            loop.run_in_executor(self._io_executor, self.file_service.read_file_once, minutes_pdf_path)
+        )
+        return await loop.run_in_executor(
+            self._io_executor,
+            lambda: self.send_minutes_to_user(
+                user_id,
+                minutes_pdf_path,
+                meeting_title,
+                user_message,
+                file_content,
+                channel_id=channel_id
+            )
+        )
+    
+    def send_minutes_to_user(self, user_id, minutes_pdf_path, meeting_title, user_message=None, file_content=None, message=None, channel_id=None):
         """
         회의록 PDF를 특정 사용자에게 전송합니다.
         
@@ -120,57 +353,80 @@ class MattermostManager:
             user_id (str): Mattermost 사용자 ID
             minutes_pdf_path (str): 회의록 PDF 파일 경로
             meeting_title (str): 회의 제목
+            user_message (str, optional): 추가 메시지
+            file_content (bytes, optional): 미리 읽어 둔 회의록 파일 내용
+            message (str, optional): 미리 생성해 둔 회의록 공유 메시지 (없으면 새로 생성)
+            channel_id (str, optional): 미리 확보한 DM 채널 ID (없으면 새로 조회)
             
         Returns:
             Dict[str, Any]: 전송 결과 정보
         """
-        # 1. 임시 DM 채널 생성
-        channel_result = self.message_service.send_message_to_user(
-            message="회의록 파일을 전송 준비 중입니다...",
-            user_id=user_id
-        )
+        # 1. DM 채널 조회 (캐시된 채널이 있으면 API 호출 없음)
+        if not channel_id:
+            channel_id = self.message_service.get_or_create_dm_channel(user_id)
         
-        if not channel_result["success"]:
+        if not channel_id:
             return {
                 "success": False,
-                "message": f"DM 채널 생성 실패: {channel_result['message']}",
-                "details": channel_result
+                "message": f"DM 채널 생성 실패: {user_id}",
+                "details": {"user_id": user_id}
             }
         
-        channel_id = channel_result["data"].get("channel_id") or channel_result["data"].get("id")
-        
         # 2. 파일 업로드
         file_result = self.file_service.upload_file(
             channel_id=channel_id,
-            file_path=minutes_pdf_path
+            file_path=minutes_pdf_path,
+            file_content=file_content
         )
         
+        # 캐시된 DM 채널이 무효해진 경우 캐시를 비우고 채널을 다시 확보해 한 번만 재시도
+        if (
+            not file_result["success"]
+            and file_result.get("status_code") in STALE_CHANNEL_STATUS_CODES
+            and self.message_service.invalidate_dm_channel(user_id)
+        ):
+            channel_id = self.message_service.get_or_create_dm_channel(user_id)
+            if not channel_id:
+                return {
+                    "success": False,
+                    "message": f"DM 채널 재생성 실패: {user_id}",
+                    "status_code": file_result.get("status_code"),
+                    "details": {"user_id": user_id, "file": file_result}
+                }
+            
+            file_result = self.file_service.upload_file(
+                channel_id=channel_id,
+                file_path=minutes_pdf_path,
+                file_content=file_content
+            )
+        
         if not file_result["success"]:
             return {
                 "success": False,
                 "message": f"파일 업로드 실패: {file_result['message']}",
+                "status_code": file_result.get("status_code"),
                 "details": file_result
             }
         
         file_id = file_result["file_id"]
         
         # 3. 회의록 메시지 전송
-        message = f"📝 **{meeting_title}** 회의록을 공유합니다.\n\n"
-        message += "회의 내용을 확인하시고 피드백이나 질문이 있으시면 알려주세요."
+        if message is None:
+            message = self._build_minutes_message(meeting_title, user_message)
         
-        send_result = self.message_service.send_message_to_user(
+        send_result = self.message_service.send_message_to_channel(
+            channel_id=channel_id,
             message=message,
-            user_id=user_id,
-            file_ids=[file_id],
-            channel_id=channel_id
+            file_ids=[file_id]
         )
         
         if not send_result["success"]:
             return {
                 "success": False,
                 "message": f"메시지 전송 실패: {send_result['message']}",
+                "status_code": send_result.get("status_code"),
                 "details": {
-                    "channel": channel_result,
+                    "channel_id": channel_id,
                     "file": file_result,
                     "message": send_result
                 }
@@ -187,5 +443,16 @@ class MattermostManager:
         }
 
 
-# MattermostManager의 싱글톤 인스턴스 생성
-mattermost_manager = MattermostManager()
+@functools.lru_cache(maxsize=1)
+def get_manager() -> MattermostManager:
+    """
+    MattermostManager 싱글톤 인스턴스를 반환합니다 (lru_cache로 한 번만 생성).
+    최초 생성 시 백그라운드 연결 예열을 한 번 시작합니다.
+    """
+    manager = MattermostManager()
+    manager.message_service.warm_up_connection()
+    return manager
+
+
+# MattermostManager 싱글톤 (모듈 임포트 시 생성하지 않고 최초 사용 시 get_manager()로 생성)
+mattermost_manager = _LazyProxy(get_manager)
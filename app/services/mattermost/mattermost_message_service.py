@@ -3,28 +3,64 @@ Mattermost 메시지 서비스
 Mattermost 채널과 사용자에게 메시지를 전송하는 기능을 제공합니다.
 """
 import logging
-import json
+import threading
+import types
 from typing import Optional, List, Dict, Any
-import traceback
-import requests
-from app.services.mattermost.mattermost_core import mattermost_client, api_session, initialize_mattermost_client, MATTERMOST_URL, MATTERMOST_TOKEN
+from cachetools import TTLCache
+from app.services.mattermost.mattermost_core import (
+    api_session, parse_json_response, HTTP_TIMEOUT, NOT_CONFIGURED_MESSAGE, is_mattermost_ready
+)
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # DEBUG 레벨로 설정
 
-# 사용자 ID와 채널 ID 매핑 테이블
-USER_CHANNEL_MAPPING = {
+# 사용자 ID와 채널 ID 매핑 테이블 (읽기 전용)
+USER_CHANNEL_MAPPING = types.MappingProxyType({
     # 사용자ID: 채널ID 매핑
     "hsk3kfeg1fbhprzha8y5fjznt": "wubqb3dh13fbieskw8mp6mjwqr",  # 김경훈
     "zep68zadnfnfba9jzwit4btj": "4drb8h34oif6ucpfj6upjik9or",  # 김다희
     "qrfanemf7yo7dq8jui8yorc1y": "5rptt34petncbc7u9x77ocipqy",  # 박재우
     "374deoeaw3butxr4mybebxpgga": "ntanqift4tdsbkn6jmo7frkkyo",  # 윤웅상
     "5qffg6wq33bgfn7uszgm6bfbo": "t3x11ds4gfb3ue1if6mda1einh",  # 오상우
-}
+})
+
+# 채널 ID -> 사용자 ID 역매핑 (읽기 전용, 선형 탐색 없이 조회)
+CHANNEL_USER_MAPPING = types.MappingProxyType(
+    {channel_id: user_id for user_id, channel_id in USER_CHANNEL_MAPPING.items()}
+)
 
 # 기본 채널 ID (Town Square 등)
 DEFAULT_CHANNEL_ID = "town-square"
 
+# 회의록 공유 메시지 템플릿
+MINUTES_MESSAGE_TEMPLATE = (
+    "📝 **{title}** 회의록을 공유합니다.\n\n"
+    "회의 내용을 확인하시고 피드백이나 질문이 있으시면 알려주세요."
+)
+
+# DM 채널 캐시 설정 (사용자 ID -> DM 채널 ID)
+DM_CHANNEL_CACHE_SIZE = 2048
+DM_CHANNEL_CACHE_TTL = 3600  # 초
+
+# 모듈 전역 DM 채널 캐시 (모든 MessageService 인스턴스가 공유, TTLCache는 스레드 안전하지 않아 잠금 사용)
+_dm_channel_cache = TTLCache(maxsize=DM_CHANNEL_CACHE_SIZE, ttl=DM_CHANNEL_CACHE_TTL)
+_dm_channel_cache_lock = threading.Lock()
+
+# 연결 예열은 프로세스당 한 번만 수행 (인스턴스 생성이나 모듈 임포트 시에는 수행하지 않음)
+_warm_up_started = False
+_warm_up_lock = threading.Lock()
+
+def user_for_channel(channel_id: str) -> Optional[str]:
+    """
+    매핑 테이블에 등록된 DM 채널 ID로 사용자 ID를 찾습니다.
+    
+    Args:
+        channel_id (str): Mattermost 채널 ID
+        
+    Returns:
+        Optional[str]: 사용자 ID 또는 None (매핑되지 않은 채널)
+    """
+    return CHANNEL_USER_MAPPING.get(channel_id)
+
 class MessageService:
     """Mattermost 메시지 전송 기능을 제공하는 클래스"""
     
@@ -35,9 +71,100 @@ class MessageService:
         Args:
             test_mode (bool): 테스트 모드 여부. True이면 실제 API 호출 없이 성공 응답 반환
         """
-        self.client = mattermost_client
+        # 모든 요청은 튜닝된 공유 세션(연결 풀, 재시도, orjson)으로 처리
         self.api = api_session
         self.test_mode = test_mode
+        
+        # 봇 사용자 ID (최초 DM 채널 생성 시 조회)
+        self._bot_id = None
+    
+    def warm_up_connection(self) -> bool:
+        """
+        첫 사용자 요청이 TCP/TLS 핸드셰이크 비용을 치르지 않도록 백그라운드에서 연결을 미리 열어 둡니다.
+        프로세스당 한 번만 실행되며, 앱 시작 시점(get_manager 최초 호출)에 호출됩니다.
+        
+        Returns:
+            bool: 이번 호출에서 예열을 시작했는지 여부
+        """
+        global _warm_up_started
+        if self.test_mode or not is_mattermost_ready():
+            return False
+        with _warm_up_lock:
+            if _warm_up_started:
+                return False
+            _warm_up_started = True
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+        return True
+    
+    def _warm_connection(self) -> None:
+        """봇 사용자 ID를 조회하며 연결 풀에 keep-alive 연결을 만들어 둡니다."""
+        try:
+            self._get_bot_id()
+        except Exception as e:
+            logger.warning("Mattermost 연결 예열 실패: %s", e)
+    
+    def _create_dm_channel(self, bot_id: str, user_id: str) -> Dict[str, Any]:
+        """
+        REST API로 봇과 사용자 간의 DM 채널을 생성(또는 조회)합니다.
+        
+        Args:
+            bot_id (str): 봇 사용자 ID
+            user_id (str): 대화할 사용자의 Mattermost ID
+            
+        Returns:
+            Dict[str, Any]: 생성 결과 (success, message, channel_id, status_code)
+        """
+        result = {"success": False, "message": "", "channel_id": None, "status_code": None}
+        session = self.api["session"]
+        url = self.api["api_url"] + "/channels/direct"
+        
+        response = session.post(url, json=(bot_id, user_id), timeout=HTTP_TIMEOUT)
+        result["status_code"] = response.status_code
+        if response.status_code in [200, 201]:
+            result["channel_id"] = parse_json_response(response).get("id")
+            result["success"] = result["channel_id"] is not None
+            return result
+        
+        result["message"] = f"DM 채널 생성 실패: {response.status_code} - {response.text}"
+        return result
+    
+    def _get_bot_id(self) -> str:
+        """봇 사용자 ID를 조회합니다. 최초 1회만 API를 호출합니다."""
+        if self._bot_id is None:
+            response = self.api["session"].get(
+                self.api["api_url"] + "/users/me",
+                timeout=HTTP_TIMEOUT
+            )
+            response.raise_for_status()
+            self._bot_id = parse_json_response(response)['id']
+        return self._bot_id
+    
+    def _create_post(self, message_data: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """
+        공유 세션으로 게시물을 생성하고 결과를 result에 기록합니다.
+        
+        Args:
+            message_data (Dict[str, Any]): 게시물 생성 요청 본문
+            result (Dict[str, Any]): 전송 결과를 기록할 딕셔너리
+            
+        Returns:
+            bool: 게시물 생성 성공 여부 (HTTP 오류는 예외 없이 result에 기록)
+        """
+        session = self.api["session"]
+        post_url = self.api["api_url"] + "/posts"
+        
+        # json= 인자는 MattermostSession이 orjson으로 한 번에 직렬화 (헤더는 세션 공통 설정 사용)
+        response = session.post(post_url, json=message_data, timeout=HTTP_TIMEOUT)
+        
+        if response.status_code in [200, 201]:
+            result["success"] = True
+            result["data"] = parse_json_response(response)
+            return True
+        
+        result["status_code"] = response.status_code
+        result["message"] = f"메시지 전송 실패: {response.status_code} - {response.text}"
+        logger.error(result["message"])
+        return False
     
     def send_message_to_user(
         self, 
@@ -65,6 +192,10 @@ class MessageService:
                 result["success"] = True
                 result["message"] = "테스트 모드: 메시지가 성공적으로 전송된 것으로 처리됨"
                 return result
+            
+            if not is_mattermost_ready():
+                result["message"] = NOT_CONFIGURED_MESSAGE
+                return result
                 
             # 채널 ID가 없으면 매핑 테이블에서 조회
             if not channel_id and user_id:
@@ -72,6 +203,7 @@ class MessageService:
                 
                 if not channel_id:
                     result["message"] = "채널 ID 조회 실패"
+                    logger.error("%s: %s", result["message"], user_id)
                     return result
             
             if not channel_id:
@@ -85,55 +217,56 @@ class MessageService:
                 if not message.startswith(f"@"):
                     message = f"@{user_id} {message}"
             
-            # 메시지 전송
+            # 메시지 전송 (첨부 파일이 있을 때만 file_ids 포함)
             message_data = {
                 "channel_id": channel_id,
-                "message": message
+                "message": message,
+                **({"file_ids": file_ids} if file_ids else {})
             }
             
-            if file_ids:
-                message_data["file_ids"] = file_ids
-            
-            if self.client:
-                # mattermostdriver를 사용하는 경우
-                post_result = self.client.posts.create_post(options=message_data)
-                result["success"] = True
-                result["data"] = post_result
-            else:
-                # 직접 API 호출을 사용하는 경우
-                post_url = f"{MATTERMOST_URL}/api/v4/posts"
-                headers = {
-                    'Authorization': f'Bearer {MATTERMOST_TOKEN}',
-                    'Content-Type': 'application/json'
-                }
-                
-                response_post = requests.post(
-                    post_url, 
-                    headers=headers, 
-                    data=json.dumps(message_data), 
-                    verify=False
-                )
-                
-                if response_post.status_code in [200, 201]:
-                    result["success"] = True
-                    result["data"] = response_post.json()
-                else:
-                    raise Exception(f"메시지 전송 실패: {response_post.status_code} - {response_post.text}")
+            # 공유 세션으로 전송 (keep-alive 연결 재사용)
+            if not self._create_post(message_data, result):
+                return result
             
             result["message"] = "메시지가 성공적으로 전송되었습니다."
-            logger.info(f"Message sent to channel_id: {channel_id}")
+            logger.info("Message sent to channel_id: %s", channel_id)
             return result
             
         except Exception as e:
             error_msg = f"메시지 전송 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             result["message"] = error_msg
             return result
             
+    def get_or_create_dm_channel(self, user_id: str) -> Optional[str]:
+        """
+        봇과 사용자 간의 DM 채널 ID를 반환합니다. 메시지를 보내지 않고 채널만 확보합니다.
+        
+        Args:
+            user_id (str): 대화할 사용자의 Mattermost ID
+            
+        Returns:
+            Optional[str]: 채널 ID 또는 None (실패 시)
+        """
+        return self._create_or_get_direct_message_channel(user_id)
+    
+    def invalidate_dm_channel(self, user_id: str) -> bool:
+        """
+        캐시된 DM 채널 ID를 제거합니다. (채널이 삭제되었거나 접근할 수 없게 된 경우)
+        
+        Args:
+            user_id (str): 대화할 사용자의 Mattermost ID
+            
+        Returns:
+            bool: 캐시에서 제거된 항목이 있었는지 여부
+        """
+        with _dm_channel_cache_lock:
+            return _dm_channel_cache.pop(user_id, None) is not None
+    
     def _create_or_get_direct_message_channel(self, user_id: str) -> Optional[str]:
         """
         봇과 사용자 간의 DM 채널을 가져옵니다.
+        매핑 테이블과 캐시에 없으면 REST API로 DM 채널을 생성합니다.
         
         Args:
             user_id (str): 대화할 사용자의 Mattermost ID
@@ -141,22 +274,37 @@ class MessageService:
         Returns:
             Optional[str]: 채널 ID 또는 None (실패 시)
         """
+        # 매핑 테이블에 있는 사용자는 예외 처리/로깅 없이 바로 반환 (가장 빈번한 경로)
+        channel_id = USER_CHANNEL_MAPPING.get(user_id)
+        if channel_id:
+            return channel_id
+        
         try:
-            logger.info(f"Getting DM channel for user: {user_id}")
-            
-            # 매핑 테이블에서 채널 ID 확인
-            if user_id in USER_CHANNEL_MAPPING:
-                channel_id = USER_CHANNEL_MAPPING[user_id]
-                logger.info(f"Found channel ID in mapping table: {channel_id}")
+            # 이전에 생성한 DM 채널 캐시 확인
+            with _dm_channel_cache_lock:
+                channel_id = _dm_channel_cache.get(user_id)
+            if channel_id:
+                logger.info("Found channel ID in DM cache: %s", channel_id)
                 return channel_id
             
-            # 매핑 테이블에 없는 경우, 오류 로그 출력 후 None 반환
-            logger.error(f"사용자 ID {user_id}에 대한 매핑된 채널을 찾을 수 없습니다.")
-            return None
+            # 매핑 테이블에 없는 경우, DM 채널 생성(또는 기존 채널 조회)
+            create_result = self._create_dm_channel(self._get_bot_id(), user_id)
+            if not create_result["success"]:
+                logger.error(
+                    "사용자 ID %s에 대한 DM 채널을 생성할 수 없습니다: %s",
+                    user_id, create_result["message"]
+                )
+                return None
+            channel_id = create_result["channel_id"]
+            
+            with _dm_channel_cache_lock:
+                _dm_channel_cache[user_id] = channel_id
+            
+            logger.info("Created DM channel: %s", channel_id)
+            return channel_id
                 
         except Exception as e:
-            logger.error(f"채널 ID 조회 중 오류 발생: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("채널 ID 조회 중 오류 발생: %s", e)
             return None
     
     def send_message_to_channel(
@@ -183,50 +331,29 @@ class MessageService:
                 result["success"] = True
                 result["message"] = "테스트 모드: 메시지가 성공적으로 전송된 것으로 처리됨"
                 return result
+            
+            if not is_mattermost_ready():
+                result["message"] = NOT_CONFIGURED_MESSAGE
+                return result
                 
-            # 메시지 데이터 준비
+            # 메시지 데이터 준비 (첨부 파일이 있을 때만 file_ids 포함)
             message_data = {
                 "channel_id": channel_id,
-                "message": message
+                "message": message,
+                **({"file_ids": file_ids} if file_ids else {})
             }
             
-            if file_ids:
-                message_data["file_ids"] = file_ids
-            
-            if self.client:
-                # mattermostdriver를 사용하는 경우
-                post_result = self.client.posts.create_post(options=message_data)
-                result["success"] = True
-                result["data"] = post_result
-            else:
-                # 직접 API 호출을 사용하는 경우
-                post_url = f"{MATTERMOST_URL}/api/v4/posts"
-                headers = {
-                    'Authorization': f'Bearer {MATTERMOST_TOKEN}',
-                    'Content-Type': 'application/json'
-                }
-                
-                response = requests.post(
-                    post_url, 
-                    headers=headers, 
-                    data=json.dumps(message_data), 
-                    verify=False
-                )
-                
-                if response.status_code in [200, 201]:
-                    result["success"] = True
-                    result["data"] = response.json()
-                else:
-                    raise Exception(f"메시지 전송 실패: {response.status_code} - {response.text}")
+            # 공유 세션으로 전송 (keep-alive 연결 재사용)
+            if not self._create_post(message_data, result):
+                return result
             
             result["message"] = "메시지가 성공적으로 전송되었습니다."
-            logger.info(f"Message sent to channel_id: {channel_id}")
+            logger.info("Message sent to channel_id: %s", channel_id)
             return result
             
         except Exception as e:
             error_msg = f"채널 메시지 전송 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             result["message"] = error_msg
             return result
     
@@ -248,8 +375,7 @@ class MessageService:
             Dict[str, Any]: 전송 결과 및 관련 정보
         """
         # 회의록 전송 메시지 생성
-        message = f"📝 **{meeting_title}** 회의록을 공유합니다.\n\n"
-        message += "회의 내용을 확인하시고 피드백이나 질문이 있으시면 알려주세요."
+        message = MINUTES_MESSAGE_TEMPLATE.format(title=meeting_title)
         
         # 첨부 파일 ID 목록
         file_ids = [minutes_file_id] if minutes_file_id else []
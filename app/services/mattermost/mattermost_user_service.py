@@ -2,24 +2,78 @@
 Mattermost 사용자 서비스
 Mattermost 사용자 및 채널 관련 기능을 제공합니다.
 """
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-import traceback
-from app.services.mattermost.mattermost_core import mattermost_client, api_session
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Iterator
+from cachetools import TTLCache
+from app.services.mattermost.mattermost_core import (
+    api_session, parse_json_response, HTTP_TIMEOUT, NOT_CONFIGURED_MESSAGE, is_mattermost_ready,
+    io_executor
+)
 
 logger = logging.getLogger(__name__)
 
+# 사용자명/채널명 -> ID 조회 결과 캐시 설정
+LOOKUP_CACHE_SIZE = 4096
+LOOKUP_CACHE_TTL = 3600  # 1시간 (ID 매핑은 거의 바뀌지 않음)
+LOOKUP_NEGATIVE_CACHE_TTL = 60  # 찾지 못한 결과는 오타가 오래 고정되지 않도록 짧게 유지
+
+# 모듈 전역 조회 캐시 (모든 UserService 인스턴스가 공유, TTLCache는 스레드 안전하지 않아 잠금 사용)
+_user_id_cache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+_user_id_negative_cache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_NEGATIVE_CACHE_TTL)
+_channel_id_cache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+_channel_id_negative_cache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_NEGATIVE_CACHE_TTL)
+_lookup_cache_lock = threading.Lock()
+
+# 팀 ID 없이 채널을 찾을 때 사용하는 채널 이름 -> (채널 ID, 팀 ID, 표시 이름) 역색인
+CHANNEL_INDEX_TTL = 600  # 10분
+CHANNEL_INDEX_MAX_WORKERS = 8  # 색인 생성 시 팀별 채널 목록을 동시에 가져올 최대 스레드 수
+
+# 사용자 목록 페이지 조회 설정
+USER_PAGE_SIZE = 200  # Mattermost per_page 최대값
+USER_PAGE_CONCURRENCY = 4  # 동시에 미리 가져올 페이지 수
+_channel_name_index: Dict[str, Tuple[str, str, str]] = {}
+_channel_index_built_at = 0.0
+_channel_index_lock = threading.Lock()  # 동시 미스 시 색인 중복 생성 방지
+
+
+def _cached_lookup(cache: TTLCache, negative_cache: TTLCache, key, lookup) -> Dict[str, Any]:
+    """
+    TTL 캐시를 거쳐 조회 함수를 호출합니다.
+    
+    성공 결과는 긴 TTL로, '찾을 수 없음' 결과는 짧은 TTL로 캐시하며
+    API 오류 결과는 캐시하지 않습니다. 호출자가 결과를 수정해도 캐시가
+    오염되지 않도록 항상 사본을 반환합니다.
+    """
+    with _lookup_cache_lock:
+        cached = cache.get(key) or negative_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    
+    result = lookup()
+    not_found = result.pop("not_found", False)
+    if result["success"]:
+        with _lookup_cache_lock:
+            cache[key] = dict(result)
+    elif not_found:
+        with _lookup_cache_lock:
+            negative_cache[key] = dict(result)
+    return result
+
 class UserService:
     """Mattermost 사용자 및 채널 관련 기능을 제공하는 클래스"""
     
     def __init__(self):
         """사용자 서비스를 초기화합니다."""
-        self.client = mattermost_client
         self.api = api_session
     
     def find_user_id_by_username(self, username: str) -> Dict[str, Any]:
         """
         Mattermost 사용자 이름으로 사용자 ID를 찾습니다.
+        조회 결과는 TTL 캐시에 보관되어 반복 조회 시 API를 호출하지 않습니다.
         
         Args:
             username (str): Mattermost 사용자명 (@ 기호 포함 가능)
@@ -27,59 +81,120 @@ class UserService:
         Returns:
             Dict[str, Any]: 검색 결과 및 사용자 ID 정보
         """
-        result = {"success": False, "message": "", "user_id": None, "username": None}
+        return self.find_user_ids_by_usernames([username])[0]
+    
+    def find_user_ids_by_usernames(self, usernames: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 Mattermost 사용자 이름의 사용자 ID를 한 번의 API 호출로 찾습니다.
+        캐시에 있는 사용자명은 API 호출 없이 캐시에서 바로 반환합니다.
+        
+        Args:
+            usernames (List[str]): Mattermost 사용자명 목록 (@ 기호 포함 가능)
+            
+        Returns:
+            List[Dict[str, Any]]: 입력 순서와 같은 순서의 사용자별 검색 결과
+        """
+        # @ 기호 제거 후 소문자로 정규화 (Mattermost 사용자명은 대소문자를 구분하지 않음)
+        names = [(name[1:] if name.startswith('@') else name).lower() for name in usernames]
+        
+        results = {}
+        with _lookup_cache_lock:
+            for name in dict.fromkeys(names):
+                cached = _user_id_cache.get(name) or _user_id_negative_cache.get(name)
+                if cached is not None:
+                    results[name] = cached
+        
+        # 캐시에 없는 사용자명만 중복 없이 한 번에 조회
+        misses = [name for name in dict.fromkeys(names) if name not in results]
+        if misses:
+            for name, result in self._lookup_user_ids(misses).items():
+                not_found = result.pop("not_found", False)
+                if result["success"]:
+                    with _lookup_cache_lock:
+                        _user_id_cache[name] = result
+                elif not_found:
+                    with _lookup_cache_lock:
+                        _user_id_negative_cache[name] = result
+                results[name] = result
         
-        # @ 기호 제거
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 사본 반환
+        return [dict(results[name]) for name in names]
+    
+    def invalidate(self, username: str) -> None:
+        """
+        캐시된 사용자 ID 조회 결과를 제거합니다.
+        
+        Args:
+            username (str): Mattermost 사용자명 (@ 기호 포함 가능)
+        """
         if username.startswith('@'):
             username = username[1:]
+        username = username.lower()
+        with _lookup_cache_lock:
+            _user_id_cache.pop(username, None)
+            _user_id_negative_cache.pop(username, None)
+    
+    def invalidate_channel(self, channel_name: str, team_id: Optional[str] = None) -> None:
+        """
+        캐시된 채널 ID 조회 결과를 제거합니다.
+        
+        Args:
+            channel_name (str): Mattermost 채널 이름
+            team_id (str, optional): 채널이 속한 팀 ID
+        """
+        key = (team_id, channel_name)
+        with _lookup_cache_lock:
+            _channel_id_cache.pop(key, None)
+            _channel_id_negative_cache.pop(key, None)
+    
+    def _lookup_user_ids(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """캐시를 거치지 않고 Mattermost API로 여러 사용자 ID를 한 번에 조회합니다."""
+        results = {
+            name: {"success": False, "message": "", "user_id": None, "username": None}
+            for name in usernames
+        }
+        
+        if not is_mattermost_ready():
+            for result in results.values():
+                result["message"] = NOT_CONFIGURED_MESSAGE
+            return results
         
         try:
-            if self.client:
-                # mattermostdriver를 사용하는 경우
-                users = self.client.users.get_users_by_usernames([username])
-                if users and len(users) > 0:
-                    user_id = users[0].get('id')
-                    found_username = users[0].get('username')
+            session = self.api["session"]
+            url = self.api["api_url"] + "/users/usernames"
+            
+            response = session.post(url, json=usernames, timeout=HTTP_TIMEOUT)
+            if response.status_code >= 400:
+                error_msg = f"사용자 검색 API 호출 실패: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                for result in results.values():
+                    result["message"] = error_msg
+                return results
+            users = parse_json_response(response)
+            
+            found = {user.get('username', '').lower(): user for user in users or []}
+            for name, result in results.items():
+                user = found.get(name)
+                if user:
+                    user_id = user.get('id')
                     result["success"] = True
                     result["user_id"] = user_id
-                    result["username"] = found_username
-                    result["message"] = f"사용자 찾기 성공: {username} -> {user_id}"
-                    logger.info(f"User found: {username} -> {user_id}")
+                    result["username"] = user.get('username')
+                    result["message"] = f"사용자 찾기 성공: {name} -> {user_id}"
+                    logger.info("User found: %s -> %s", name, user_id)
                 else:
-                    result["message"] = f"사용자를 찾을 수 없습니다: {username}"
+                    result["message"] = f"사용자를 찾을 수 없습니다: {name}"
+                    result["not_found"] = True
                     logger.warning(result["message"])
-            else:
-                # 직접 API 호출을 사용하는 경우
-                session = self.api["session"]
-                base_url = self.api["base_url"]
-                url = f"{base_url}/api/v4/users/usernames"
-                
-                response = session.post(url, json=[username])
-                if response.status_code < 400:
-                    users = response.json()
-                    if users and len(users) > 0:
-                        user_id = users[0].get('id')
-                        found_username = users[0].get('username')
-                        result["success"] = True
-                        result["user_id"] = user_id
-                        result["username"] = found_username
-                        result["message"] = f"사용자 찾기 성공: {username} -> {user_id}"
-                        logger.info(f"User found: {username} -> {user_id}")
-                    else:
-                        result["message"] = f"사용자를 찾을 수 없습니다: {username}"
-                        logger.warning(result["message"])
-                else:
-                    result["message"] = f"사용자 검색 API 호출 실패: {response.status_code} - {response.text}"
-                    logger.error(result["message"])
             
-            return result
+            return results
             
         except Exception as e:
             error_msg = f"사용자 검색 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
-            result["message"] = error_msg
-            return result
+            logger.exception(error_msg)
+            for result in results.values():
+                result["message"] = error_msg
+            return results
     
     def find_channel_id_by_name(
         self, 
@@ -88,6 +203,7 @@ class UserService:
     ) -> Dict[str, Any]:
         """
         Mattermost 채널 이름으로 채널 ID를 찾습니다.
+        조회 결과는 (팀 ID, 채널 이름) 키로 TTL 캐시에 보관됩니다.
         
         Args:
             channel_name (str): Mattermost 채널 이름 (URL 친화적인 이름)
@@ -96,93 +212,170 @@ class UserService:
         Returns:
             Dict[str, Any]: 검색 결과 및 채널 ID 정보
         """
+        return _cached_lookup(
+            _channel_id_cache,
+            _channel_id_negative_cache,
+            (team_id, channel_name),
+            lambda: self._lookup_channel_id(channel_name, team_id),
+        )
+    
+    async def find_channel_id_by_name_async(
+        self,
+        channel_name: str,
+        team_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """채널 ID 검색 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            io_executor,
+            lambda: self.find_channel_id_by_name(channel_name, team_id)
+        )
+    
+    def _lookup_channel_id(self, channel_name: str, team_id: Optional[str] = None) -> Dict[str, Any]:
+        """캐시를 거치지 않고 Mattermost API로 채널 ID를 조회합니다."""
         result = {"success": False, "message": "", "channel_id": None, "display_name": None}
         
+        if not is_mattermost_ready():
+            result["message"] = NOT_CONFIGURED_MESSAGE
+            return result
+        
         try:
-            # 팀 ID가 제공되지 않은 경우, 봇이 속한 모든 팀을 검색
-            if not team_id and self.client:
-                # 내 팀 목록 가져오기
-                try:
-                    my_teams = self.client.teams.get_user_teams('me')
-                except Exception as e:
-                    logger.error(f"내 팀 목록 가져오기 실패: {e}")
-                    my_teams = []
+            # 팀 ID가 제공되지 않은 경우, 봇이 속한 모든 팀의 채널 역색인에서 검색
+            if not team_id:
+                index, complete = self._get_channel_name_index()
+                entry = index.get(channel_name)
+                if entry:
+                    channel_id, found_team_id, display_name = entry
+                    result["success"] = True
+                    result["channel_id"] = channel_id
+                    result["display_name"] = display_name
+                    result["message"] = f"채널 찾기 성공: {channel_name} -> {channel_id} (팀: {found_team_id})"
+                    logger.info("Channel found: %s -> %s (Team: %s)", channel_name, channel_id, found_team_id)
+                    return result
                 
-                # 모든 팀에서 채널 검색
-                for team in my_teams:
-                    team_id = team.get('id')
-                    try:
-                        if self.client:
-                            # mattermostdriver를 사용하는 경우
-                            channels = self.client.channels.get_channels_for_user('me', team_id)
-                            for channel in channels:
-                                if channel.get('name') == channel_name:
-                                    channel_id = channel.get('id')
-                                    display_name = channel.get('display_name')
-                                    result["success"] = True
-                                    result["channel_id"] = channel_id
-                                    result["display_name"] = display_name
-                                    result["message"] = f"채널 찾기 성공: {channel_name} -> {channel_id} (팀: {team.get('name')})"
-                                    logger.info(f"Channel found: {channel_name} -> {channel_id} (Team: {team.get('name')})")
-                                    return result
-                    except Exception as e:
-                        logger.error(f"팀 {team.get('name')} 채널 검색 중 오류: {e}")
-                        continue
+                if not complete:
+                    # 일부 팀의 채널 목록을 가져오지 못했으므로 '찾을 수 없음'으로 단정하지 않음 (캐시하지 않음)
+                    result["message"] = f"일부 팀의 채널 목록을 가져오지 못해 채널을 확인할 수 없습니다: {channel_name}"
+                    logger.error(result["message"])
+                    return result
                 
                 result["message"] = f"모든 팀에서 채널을 찾을 수 없습니다: {channel_name}"
+                result["not_found"] = True
                 logger.warning(result["message"])
                 return result
             
             # 특정 팀에서 채널 검색
-            if team_id:
-                if self.client:
-                    # mattermostdriver를 사용하는 경우
-                    channels = self.client.channels.get_channels_for_user('me', team_id)
-                    for channel in channels:
-                        if channel.get('name') == channel_name:
-                            channel_id = channel.get('id')
-                            display_name = channel.get('display_name')
-                            result["success"] = True
-                            result["channel_id"] = channel_id
-                            result["display_name"] = display_name
-                            result["message"] = f"채널 찾기 성공: {channel_name} -> {channel_id}"
-                            logger.info(f"Channel found: {channel_name} -> {channel_id}")
-                            return result
-                else:
-                    # 직접 API 호출을 사용하는 경우
-                    session = self.api["session"]
-                    base_url = self.api["base_url"]
-                    url = f"{base_url}/api/v4/users/me/teams/{team_id}/channels"
-                    
-                    response = session.get(url)
-                    if response.status_code < 400:
-                        channels = response.json()
-                        for channel in channels:
-                            if channel.get('name') == channel_name:
-                                channel_id = channel.get('id')
-                                display_name = channel.get('display_name')
-                                result["success"] = True
-                                result["channel_id"] = channel_id
-                                result["display_name"] = display_name
-                                result["message"] = f"채널 찾기 성공: {channel_name} -> {channel_id}"
-                                logger.info(f"Channel found: {channel_name} -> {channel_id}")
-                                return result
-                    else:
-                        result["message"] = f"채널 검색 API 호출 실패: {response.status_code} - {response.text}"
-                        logger.error(result["message"])
-                        return result
+            for channel in self._get_team_channels(team_id):
+                if channel.get('name') == channel_name:
+                    channel_id = channel.get('id')
+                    result["success"] = True
+                    result["channel_id"] = channel_id
+                    result["display_name"] = channel.get('display_name')
+                    result["message"] = f"채널 찾기 성공: {channel_name} -> {channel_id}"
+                    logger.info("Channel found: %s -> %s", channel_name, channel_id)
+                    return result
             
             result["message"] = f"채널을 찾을 수 없습니다: {channel_name}"
+            result["not_found"] = True
             logger.warning(result["message"])
             return result
             
         except Exception as e:
             error_msg = f"채널 검색 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             result["message"] = error_msg
             return result
     
+    def _get_channel_name_index(self) -> Tuple[Dict[str, Tuple[str, str, str]], bool]:
+        """
+        봇이 속한 모든 팀의 채널 이름 역색인을 반환합니다.
+        색인이 없거나 TTL이 지난 경우 모든 팀을 한 번 훑어 다시 만듭니다.
+        
+        팀 목록 조회에 실패하면 예외를 그대로 전달합니다. 일부 팀의 채널 목록만 실패한 경우
+        가져온 팀만으로 만든 색인을 반환하되 저장하지 않으며(다음 조회 때 다시 생성),
+        완전한 색인인지 여부를 함께 반환합니다.
+        
+        Returns:
+            Tuple[Dict[str, Tuple[str, str, str]], bool]: 채널 이름 역색인, 모든 팀을 반영했는지 여부
+        """
+        global _channel_name_index, _channel_index_built_at
+        
+        if time.monotonic() - _channel_index_built_at < CHANNEL_INDEX_TTL:
+            return _channel_name_index, True
+        
+        with _channel_index_lock:
+            # 잠금을 기다리는 동안 다른 스레드가 색인을 만들었을 수 있음
+            if time.monotonic() - _channel_index_built_at < CHANNEL_INDEX_TTL:
+                return _channel_name_index, True
+            
+            my_teams = self._get_my_teams()
+            
+            # 팀별 채널 목록을 동시에 가져와 전체 지연을 팀 RTT 합에서 최대값으로 줄임
+            index = {}
+            if my_teams:
+                workers = min(CHANNEL_INDEX_MAX_WORKERS, len(my_teams))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    team_channels = list(executor.map(self._get_team_channels_safe, my_teams))
+            else:
+                team_channels = []
+            
+            # 팀 순서를 유지하며 색인 생성 (실패한 팀은 None)
+            failed_teams = 0
+            for team, channels in zip(my_teams, team_channels):
+                if channels is None:
+                    failed_teams += 1
+                    continue
+                team_id = team.get('id')
+                for channel in channels:
+                    # 여러 팀에 같은 이름의 채널이 있으면 먼저 찾은 팀을 사용
+                    index.setdefault(
+                        channel.get('name'),
+                        (channel.get('id'), team_id, channel.get('display_name')),
+                    )
+            
+            if failed_teams:
+                logger.warning(
+                    "Channel name index incomplete (%d of %d teams failed); not caching", failed_teams, len(my_teams)
+                )
+                return index, False
+            
+            _channel_name_index = index
+            _channel_index_built_at = time.monotonic()
+            logger.info("Channel name index built: %d channels in %d teams", len(index), len(my_teams))
+            return _channel_name_index, True
+    
+    def invalidate_channel_index(self) -> None:
+        """채널 이름 역색인을 무효화하여 다음 조회 때 다시 만들도록 합니다."""
+        global _channel_index_built_at
+        with _channel_index_lock:
+            _channel_index_built_at = 0.0
+    
+    def _get_my_teams(self) -> List[Dict[str, Any]]:
+        """봇이 속한 팀 목록을 가져옵니다."""
+        response = self.api["session"].get(
+            self.api["api_url"] + "/users/me/teams", timeout=HTTP_TIMEOUT
+        )
+        if response.status_code >= 400:
+            raise Exception(f"팀 목록 API 호출 실패: {response.status_code} - {response.text}")
+        return parse_json_response(response)
+    
+    def _get_team_channels_safe(self, team: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """팀 채널 목록을 가져오며, 실패한 팀은 None을 반환합니다."""
+        try:
+            return self._get_team_channels(team.get('id'))
+        except Exception as e:
+            logger.error("팀 %s 채널 검색 중 오류: %s", team.get('name'), e)
+            return None
+    
+    def _get_team_channels(self, team_id: str) -> List[Dict[str, Any]]:
+        """봇이 특정 팀에서 속한 채널 목록을 가져옵니다."""
+        response = self.api["session"].get(
+            f"{self.api['api_url']}/users/me/teams/{team_id}/channels", timeout=HTTP_TIMEOUT
+        )
+        if response.status_code >= 400:
+            raise Exception(f"채널 검색 API 호출 실패: {response.status_code} - {response.text}")
+        return parse_json_response(response)
+    
     def list_users(self, limit: int = 100) -> Dict[str, Any]:
         """
         Mattermost 사용자 목록을 가져옵니다.
@@ -195,36 +388,75 @@ class UserService:
         """
         result = {"success": False, "message": "", "users": []}
         
+        if not is_mattermost_ready():
+            result["message"] = NOT_CONFIGURED_MESSAGE
+            return result
+        
         try:
-            if self.client:
-                # mattermostdriver를 사용하는 경우
-                users = self.client.users.get_users(params={"per_page": limit})
+            session = self.api["session"]
+            url = f"{self.api['api_url']}/users?per_page={limit}"
+            
+            response = session.get(url, timeout=HTTP_TIMEOUT)
+            if response.status_code < 400:
+                users = parse_json_response(response)
                 result["success"] = True
                 result["users"] = users
                 result["message"] = f"사용자 목록 가져오기 성공 ({len(users)} 명)"
-                logger.info(f"User list retrieved: {len(users)} users")
+                logger.info("User list retrieved: %d users", len(users))
             else:
-                # 직접 API 호출을 사용하는 경우
-                session = self.api["session"]
-                base_url = self.api["base_url"]
-                url = f"{base_url}/api/v4/users?per_page={limit}"
-                
-                response = session.get(url)
-                if response.status_code < 400:
-                    users = response.json()
-                    result["success"] = True
-                    result["users"] = users
-                    result["message"] = f"사용자 목록 가져오기 성공 ({len(users)} 명)"
-                    logger.info(f"User list retrieved: {len(users)} users")
-                else:
-                    result["message"] = f"사용자 목록 API 호출 실패: {response.status_code} - {response.text}"
-                    logger.error(result["message"])
+                result["message"] = f"사용자 목록 API 호출 실패: {response.status_code} - {response.text}"
+                logger.error(result["message"])
             
             return result
             
         except Exception as e:
             error_msg = f"사용자 목록 가져오기 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             result["message"] = error_msg
             return result
+    
+    def iter_users(
+        self,
+        page_size: int = USER_PAGE_SIZE,
+        concurrency: int = USER_PAGE_CONCURRENCY
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Mattermost 전체 사용자를 페이지 단위로 순회합니다.
+        
+        concurrency개의 페이지를 공유 세션으로 동시에 가져오며, 사용자는 페이지 순서대로 반환됩니다.
+        페이지 크기보다 적은 사용자가 담긴 페이지를 만나면 순회를 끝냅니다.
+        
+        Args:
+            page_size (int): 페이지당 사용자 수
+            concurrency (int): 동시에 가져올 페이지 수
+            
+        Yields:
+            Dict[str, Any]: 사용자 정보 (Mattermost 연결이 설정되지 않은 경우 아무것도 반환하지 않음)
+        """
+        if not is_mattermost_ready():
+            logger.warning(NOT_CONFIGURED_MESSAGE)
+            return
+        
+        page = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                pages = executor.map(
+                    lambda p: self._get_users_page(p, page_size),
+                    range(page, page + concurrency)
+                )
+                for users in pages:
+                    yield from users
+                    if len(users) < page_size:
+                        return
+                page += concurrency
+    
+    def _get_users_page(self, page: int, page_size: int) -> List[Dict[str, Any]]:
+        """사용자 목록의 한 페이지를 가져옵니다."""
+        response = self.api["session"].get(
+            self.api["api_url"] + "/users",
+            params={"page": page, "per_page": page_size},
+            timeout=HTTP_TIMEOUT
+        )
+        if response.status_code >= 400:
+            raise Exception(f"사용자 목록 API 호출 실패: {response.status_code} - {response.text}")
+        return parse_json_response(response)
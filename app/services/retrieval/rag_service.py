@@ -2,14 +2,54 @@
 RAG (Retrieval-Augmented Generation) Service
 Provides functionality to retrieve relevant documents based on a query
 """
-import logging
-from typing import List, Dict, Any, Optional
 import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+from cachetools import LRUCache
 
 from app.schemas.llm import RetrievedDocument
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (query, top_k) results kept in the retrieval cache
+RETRIEVAL_CACHE_SIZE = 1024
+
+# Mock documents - these would be retrieved from a vector database in a real system.
+# Built once at import; RetrievedDocument is frozen, so the instances are safely shared.
+_MOCK_DOCUMENTS: Tuple[RetrievedDocument, ...] = (
+    RetrievedDocument(
+        document_id="doc1",
+        content_chunk="금감원 비공식 검사 착수 보고서가 어제 최종 배포됐습니다. 오늘은 핵심 미준수 사항 세 가지와 6월 말까지의 개선 로드맵만 확정하는 것을 목표로 하겠습니다.",
+        score=0.95,
+        metadata={"source": "meeting_minutes", "date": "2023-04-01"}
+    ),
+    RetrievedDocument(
+        document_id="doc2",
+        content_chunk="우선 기존 고객 KYC 재확인 누락 건부터 말씀드립니다. 전체 52만 건 중 12만 건이 1년 이상 갱신되지 않았습니다. 주기를 연 1회에서 반기로 단축하고, 다음 주 월요일부터 자동 알림 메일을 발송해 4월 말까지 70 % 달성을 노리겠습니다.",
+        score=0.92,
+        metadata={"source": "meeting_minutes", "date": "2023-04-01"}
+    ),
+    RetrievedDocument(
+        document_id="doc3",
+        content_chunk="다음은 STR(의심거래보고) 지연 건입니다. 최근 6개월간 지연이 7건 있었고, 특히 해외 고위험 거래 두 건은 10일 이상 늦어졌습니다. 앞으로 초안 48시간, 전자보고 72시간 내 완료를 의무화하는 규정을 개정해 두었습니다.",
+        score=0.88,
+        metadata={"source": "meeting_minutes", "date": "2023-04-01"}
+    ),
+    RetrievedDocument(
+        document_id="doc4",
+        content_chunk="정보보호 교육은 '온라인 정보 유출 대응' 20분 e-러닝 과정을 4월 18일에 오픈하고, 전 직원 100 % 이수를 목표로 합니다. 미이수자에게는 다음 달 급여 페널티를 적용한다는 점을 안내해 두었습니다.",
+        score=0.85,
+        metadata={"source": "meeting_minutes", "date": "2023-04-01"}
+    ),
+    RetrievedDocument(
+        document_id="doc5",
+        content_chunk="종합 일정은 KYC 업데이트 100 %와 STR 72시간 보고 준수를 6월 30일까지, 로그 일일 점검·암호화 최신화·정보보호 교육을 5월 15일까지, DDoS 방어 체계 구축을 5월 31일까지 완료하는 것으로 확정합니다.",
+        score=0.82,
+        metadata={"source": "meeting_minutes", "date": "2023-04-01"}
+    )
+)
+
 class RAGService:
     """
     Retrieval-Augmented Generation Service
@@ -20,6 +60,10 @@ class RAGService:
         """Initialize the RAG service"""
         logger.info("Initializing RAG Service")
         self.index_ready = False
+        # Results keyed by (normalized query, top_k); chat traffic repeats a small set of prompts
+        self._cache: LRUCache = LRUCache(maxsize=RETRIEVAL_CACHE_SIZE)
+        # In-flight searches, so concurrent identical queries share a single search
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
     
     async def initialize(self):
         """Initialize search indexes and resources"""
@@ -28,6 +72,11 @@ class RAGService:
         self.index_ready = True
         return True
     
+    @property
+    def corpus_size(self) -> int:
+        """Number of documents available for retrieval"""
+        return len(_MOCK_DOCUMENTS)
+    
     async def retrieve(self, query: str, top_k: int = 5) -> List[RetrievedDocument]:
         """
         Retrieve relevant documents based on the query
@@ -41,45 +90,36 @@ class RAGService:
         """
         logger.info(f"Retrieving documents for query: {query}, top_k: {top_k}")
         
-        # For demonstration purposes, returning mock data
-        # In a real implementation, this would perform semantic search against an index
+        # Requests for more documents than the corpus holds all return the full corpus,
+        # so clamp top_k to let them share one cache entry and search
+        top_k = min(top_k, self.corpus_size)
+        key = (query.strip().lower(), top_k)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
         
-        # Simulate retrieval delay
-        await asyncio.sleep(0.1)
+        search = self._inflight.get(key)
+        if search is None:
+            search = asyncio.ensure_future(self._search(query, top_k))
+            self._inflight[key] = search
+            search.add_done_callback(lambda _: self._inflight.pop(key, None))
         
-        # Mock documents - these would be retrieved from a vector database in a real system
-        documents = [
-            RetrievedDocument(
-                document_id="doc1",
-                content_chunk="금감원 비공식 검사 착수 보고서가 어제 최종 배포됐습니다. 오늘은 핵심 미준수 사항 세 가지와 6월 말까지의 개선 로드맵만 확정하는 것을 목표로 하겠습니다.",
-                score=0.95,
-                metadata={"source": "meeting_minutes", "date": "2023-04-01"}
-            ),
-            RetrievedDocument(
-                document_id="doc2",
-                content_chunk="우선 기존 고객 KYC 재확인 누락 건부터 말씀드립니다. 전체 52만 건 중 12만 건이 1년 이상 갱신되지 않았습니다. 주기를 연 1회에서 반기로 단축하고, 다음 주 월요일부터 자동 알림 메일을 발송해 4월 말까지 70 % 달성을 노리겠습니다.",
-                score=0.92,
-                metadata={"source": "meeting_minutes", "date": "2023-04-01"}
-            ),
-            RetrievedDocument(
-                document_id="doc3",
-                content_chunk="다음은 STR(의심거래보고) 지연 건입니다. 최근 6개월간 지연이 7건 있었고, 특히 해외 고위험 거래 두 건은 10일 이상 늦어졌습니다. 앞으로 초안 48시간, 전자보고 72시간 내 완료를 의무화하는 규정을 개정해 두었습니다.",
-                score=0.88,
-                metadata={"source": "meeting_minutes", "date": "2023-04-01"}
-            ),
-            RetrievedDocument(
-                document_id="doc4",
-                content_chunk="정보보호 교육은 '온라인 정보 유출 대응' 20분 e-러닝 과정을 4월 18일에 오픈하고, 전 직원 100 % 이수를 목표로 합니다. 미이수자에게는 다음 달 급여 페널티를 적용한다는 점을 안내해 두었습니다.",
-                score=0.85,
-                metadata={"source": "meeting_minutes", "date": "2023-04-01"}
-            ),
-            RetrievedDocument(
-                document_id="doc5",
-                content_chunk="종합 일정은 KYC 업데이트 100 %와 STR 72시간 보고 준수를 6월 30일까지, 로그 일일 점검·암호화 최신화·정보보호 교육을 5월 15일까지, DDoS 방어 체계 구축을 5월 31일까지 완료하는 것으로 확정합니다.",
-                score=0.82,
-                metadata={"source": "meeting_minutes", "date": "2023-04-01"}
-            )
-        ]
+        # Shield the shared search so one cancelled caller does not cancel it for the others
+        documents = await asyncio.shield(search)
+        self._cache[key] = tuple(documents)
+        return list(documents)
+    
+    async def _search(self, query: str, top_k: int) -> List[RetrievedDocument]:
+        """
+        Search the index for documents relevant to the query (uncached)
         
-        # Return top_k documents
-        return documents[:top_k] 
\ No newline at end of file
+        Args:
+            query (str): The user query
+            top_k (int): Maximum number of documents to retrieve
+            
+        Returns:
+            List[RetrievedDocument]: List of retrieved documents
+        """
+        # For demonstration purposes, returning mock data
+        # In a real implementation, this would perform semantic search against an index
+        return list(_MOCK_DOCUMENTS[:top_k]) 
\ No newline at end of file
@@ -3,11 +3,34 @@ Thinking Service Module
 Provides functionality for generating thinking processes and reasoning steps
 """
 import logging
+import re
 from typing import List, Dict, Any, Optional
-import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Keywords that mark a visualization request (single case-insensitive scan, no lowercased copy)
+_VISUALIZATION_PATTERN = re.compile(r"visualization|시각화", re.IGNORECASE)
+
+# Mock thinking processes (stripped once at import instead of on every call)
+_VISUALIZATION_THINKING = """
+1. The user is requesting visualization of data.
+2. First I need to understand what kind of data they want to visualize.
+3. Based on the context, it appears to be related to financial compliance information.
+4. The appropriate visualization type will depend on the specific data:
+   - For comparison of values: bar chart
+   - For proportions: pie chart
+   - For trends over time: line chart or timeline
+5. I'll extract relevant data points from the retrieved documents and create a visualization.
+""".strip()
+
+_DEFAULT_THINKING = """
+1. The user is asking a question that requires information retrieval.
+2. I need to search for relevant documents that might contain the answer.
+3. After retrieving documents, I'll analyze their contents to find the specific information.
+4. I'll formulate a comprehensive response based on the information found.
+5. If there are any gaps in the information, I'll acknowledge them in my response.
+""".strip()
+
 class ThinkingService:
     """
     Thinking Service
@@ -18,9 +41,11 @@ class ThinkingService:
         """Initialize the thinking service"""
         logger.info("Initializing Thinking Service")
     
-    async def generate_thinking(self, prompt: str) -> str:
+    def generate_thinking_sync(self, prompt: str) -> str:
         """
-        Generate thinking process based on the prompt
+        Generate thinking process based on the prompt without awaiting
+        
+        Safe to call from a coroutine because it performs no I/O.
         
         Args:
             prompt (str): The prompt to generate thinking for
@@ -33,28 +58,21 @@ class ThinkingService:
         # For demonstration purposes, returning mock data
         # In a real implementation, this would use an LLM to generate thinking
         
-        # Simulate thinking delay
-        await asyncio.sleep(0.2)
-        
         # Mock thinking process for visualization request
-        if "visualization" in prompt.lower() or "시각화" in prompt:
-            thinking = """
-1. The user is requesting visualization of data.
-2. First I need to understand what kind of data they want to visualize.
-3. Based on the context, it appears to be related to financial compliance information.
-4. The appropriate visualization type will depend on the specific data:
-   - For comparison of values: bar chart
-   - For proportions: pie chart
-   - For trends over time: line chart or timeline
-5. I'll extract relevant data points from the retrieved documents and create a visualization.
-            """
-        else:
-            thinking = """
-1. The user is asking a question that requires information retrieval.
-2. I need to search for relevant documents that might contain the answer.
-3. After retrieving documents, I'll analyze their contents to find the specific information.
-4. I'll formulate a comprehensive response based on the information found.
-5. If there are any gaps in the information, I'll acknowledge them in my response.
-            """
+        if _VISUALIZATION_PATTERN.search(prompt):
+            return _VISUALIZATION_THINKING
+        return _DEFAULT_THINKING
+    
+    async def generate_thinking(self, prompt: str) -> str:
+        """
+        Generate thinking process based on the prompt
+        
+        Kept for callers that await; a real LLM-backed implementation would do its I/O here.
         
-        return thinking.strip() 
\ No newline at end of file
+        Args:
+            prompt (str): The prompt to generate thinking for
+            
+        Returns:
+            str: Generated thinking process
+        """
+        return self.generate_thinking_sync(prompt)
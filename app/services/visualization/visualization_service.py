@@ -2,34 +2,235 @@
 시각화 서비스 모듈
 회의 내용에서 데이터를 추출하고 시각화하는 서비스를 제공합니다.
 """
+import asyncio
+import functools
 import logging
+import multiprocessing
 import os
-import json
-import plotly
-import plotly.graph_objects as go
-import plotly.express as px
+import re
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # 서버 환경에서 필요한 백엔드 설정
-from matplotlib import font_manager, rc
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.patheffects as path_effects  # 경로 효과 모듈 직접 임포트
 import seaborn as sns
 import numpy as np
 import io
-import base64
-import uuid
-import random
-import string
-import glob
-from typing import List, Dict, Any, Optional, Tuple, Union, AsyncGenerator
+import pybase64
+import secrets
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from cachetools import LRUCache
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
-from app.schemas.visualization import ChartType, MeetingDataPoint, VisualizationResponse
+from app.core.config import settings
+from app.schemas.visualization import ChartType, MeetingDataPoint
 from app.schemas.chat import RetrievedDocument
-from kaleido.scopes.plotly import PlotlyScope
 
 # 로그 설정
 logger = logging.getLogger(__name__)
 
+# Seaborn 기본 스타일 설정 (전역 rcParams이므로 모듈 로드 시 1회만 적용, 한글 폰트는 서비스 초기화 시 그 위에 설정)
+sns.set(style="whitegrid")
+
+# 차트 렌더링 프로세스 풀 설정
+# pyplot은 전역 상태를 사용하므로 스레드 대신 별도 프로세스에서 렌더링합니다. (0이면 직접 렌더링)
+CHART_RENDER_MAX_WORKERS = max(0, settings.VISUALIZATION_RENDER_WORKERS)
+# 스레드가 많은 서버 프로세스를 fork하면 잠금 상태까지 복제되므로 forkserver(미지원 플랫폼은 spawn)로 시작
+CHART_RENDER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+# 렌더링 결과 캐시 (시나리오 데이터가 고정되어 같은 차트가 반복 요청됨)
+RENDER_CACHE_SIZE = 64
+_render_cache: LRUCache = LRUCache(maxsize=RENDER_CACHE_SIZE)
+_render_cache_lock = threading.Lock()
+
+# 렌더링마다 결과가 달라지는 차트 유형 (캐시하지 않음)
+_UNCACHED_CHART_TYPES = frozenset({ChartType.SCATTER})
+
+# PNG 압축 수준 (0~9). 차트 이미지는 단색 영역이 많아 낮은 수준에서도 크기 차이가 작고 인코딩은 훨씬 빠릅니다.
+PNG_COMPRESS_LEVEL = 1
+
+# 차트 유형 키워드 (그룹 이름 = ChartType 값)
+_CHART_KEYWORD_PATTERN = re.compile(
+    r"(?P<pie>파이|원형|비율)|(?P<bar>막대|바|비교)|(?P<line>선|추세|변화|시간)"
+    r"|(?P<scatter>산점도|분포)|(?P<timeline>타임라인|일정)"
+)
+_CHART_TYPE_PRIORITY = (ChartType.PIE, ChartType.BAR, ChartType.LINE, ChartType.SCATTER, ChartType.TIMELINE)
+
+# 회의 데이터 추출 요청 분류용 키워드
+_MEETING_KEYWORD_PATTERN = re.compile(
+    "|".join(map(re.escape, (
+        "미갱신", "고객", "비율", "str", "지연", "보고", "규제", "준수",
+        "일정", "로드맵", "타임라인", "보안", "정보보호", "ddos", "kyc",
+    )))
+)
+
+# 시나리오별 시각화 데이터 (요청마다 모델을 다시 검증하지 않도록 모듈 로드 시 1회 생성)
+_MEETING_DATA_TEMPLATES = types.MappingProxyType({
+    "kyc_pie": (
+        (
+            MeetingDataPoint(label="1년 이상 미갱신", value=120000, category="미준수"),
+            MeetingDataPoint(label="정상 갱신", value=400000, category="준수"),
+        ),
+        ChartType.PIE,
+        "고객 KYC 갱신 현황",
+    ),
+    "str_bar": (
+        (
+            MeetingDataPoint(label="정상 보고", value=93, category="준수"),
+            MeetingDataPoint(label="일반 거래 지연", value=5, category="경미한 지연"),
+            MeetingDataPoint(label="고위험 거래 지연", value=2, category="중대한 지연"),
+        ),
+        ChartType.BAR,
+        "STR 보고 준수 현황 (최근 6개월)",
+    ),
+    "compliance_timeline": (
+        (
+            MeetingDataPoint(label="KYC 알림 메일 발송", value=1, timestamp="2023-04-10", category="KYC 개선"),
+            MeetingDataPoint(label="셀프 KYC 메뉴 배포", value=2, timestamp="2023-04-17", category="KYC 개선"),
+            MeetingDataPoint(label="KYC 70% 달성", value=3, timestamp="2023-04-30", category="KYC 개선"),
+            MeetingDataPoint(label="STR 72시간 규정 시행", value=2, timestamp="2023-04-07", category="STR 개선"),
+            MeetingDataPoint(label="정보보호 교육 시작", value=2, timestamp="2023-04-18", category="정보보호"),
+            MeetingDataPoint(label="암호화 업데이트 완료", value=3, timestamp="2023-05-15", category="정보보호"),
+            MeetingDataPoint(label="스크러빙 센터 계약", value=2, timestamp="2023-04-30", category="DDoS 대응"),
+            MeetingDataPoint(label="AI 트래픽 탐지 PoC", value=3, timestamp="2023-05-15", category="DDoS 대응"),
+            MeetingDataPoint(label="모의훈련 실시", value=2, timestamp="2023-05-25", category="DDoS 대응"),
+            MeetingDataPoint(label="KYC 100% 완료", value=4, timestamp="2023-06-30", category="최종 목표"),
+            MeetingDataPoint(label="DDoS 방어체계 구축", value=4, timestamp="2023-05-31", category="최종 목표"),
+        ),
+        ChartType.TIMELINE,
+        "금융 규제 준수 개선 로드맵",
+    ),
+    "security_bar": (
+        (
+            MeetingDataPoint(label="로그 점검 미흡", value=4, category="마이데이터"),
+            MeetingDataPoint(label="구형 암호화 알고리즘", value=3, category="시스템"),
+            MeetingDataPoint(label="정보보호 교육 부족", value=2, category="인력"),
+            MeetingDataPoint(label="DDoS 방어 취약", value=5, category="네트워크"),
+        ),
+        ChartType.BAR,
+        "정보보호 취약점 심각도 평가",
+    ),
+    "summary": (
+        (
+            MeetingDataPoint(label="KYC 재확인 누락", value=12, category="고객확인"),
+            MeetingDataPoint(label="STR 보고 지연", value=7, category="의심거래"),
+            MeetingDataPoint(label="거래모니터링 주기 완화", value=4, category="모니터링"),
+            MeetingDataPoint(label="정보보호 점검 미흡", value=5, category="정보보호"),
+            MeetingDataPoint(label="DDoS 대응 미비", value=4, category="보안"),
+        ),
+        ChartType.BAR,
+        "금융 규제 미준수 사항 현황",
+    ),
+})
+
+def _meeting_data(key: str) -> Tuple[List[MeetingDataPoint], ChartType, str]:
+    """시나리오 데이터를 (데이터 포인트 목록, 차트 유형, 제목) 형태로 반환합니다. 목록은 호출마다 새로 만듭니다."""
+    data_points, chart_type, title = _MEETING_DATA_TEMPLATES[key]
+    return list(data_points), chart_type, title
+
+# 차트 유형별 matplotlib 스타일 (스타일 파일을 요청마다 다시 적용하지 않도록 1회 로드)
+_CHART_STYLES = types.MappingProxyType({
+    ChartType.PIE: dict(matplotlib.style.library['seaborn-v0_8-pastel']),
+    ChartType.BAR: dict(matplotlib.style.library['seaborn-v0_8-whitegrid']),
+})
+
+# 막대 차트에 표시할 최대 막대 수 (초과하면 값이 큰 상위 항목만 표시)
+BAR_CHART_MAX_BARS = 30
+
+# 타임라인 이벤트 레이블 상자 스타일 (matplotlib이 복사해서 사용하므로 공유 가능)
+_TIMELINE_LABEL_BBOX = dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8)
+
+# 한글 폰트 후보 (이름 탐색용)
+KOREAN_FONT_NAMES = ('NanumGothic', 'Noto Sans CJK KR', 'Malgun Gothic', 'NanumBarunGothic')
+_KOREAN_FONT_PATTERN = re.compile("|".join(map(re.escape, KOREAN_FONT_NAMES)))
+
+# 한글 폰트가 없을 때 사용할 대체 문자 매핑 (한글 -> 영문)
+KOREAN_TO_ENGLISH = types.MappingProxyType({
+    '프로젝트': 'Project',
+    '연구개발': 'R&D',
+    '마케팅': 'Marketing',
+    '인프라': 'Infrastructure',
+    '인사': 'HR',
+    '기타': 'Others',
+    '총계': 'Total',
+    '구분': 'Category',
+    '값': 'Value',
+    '준수': 'Compliance',
+    '미준수': 'Non-compliance',
+    '지연': 'Delayed',
+    '정상': 'Normal',
+    '현재': 'Now',
+    '개선': 'Improvement',
+    '대응': 'Response',
+    '완료': 'Complete',
+    '시작': 'Start',
+    '달성': 'Achieved',
+    '일정': 'Schedule',
+    '계획': 'Plan',
+    '로드맵': 'Roadmap',
+    '정보보호': 'Security',
+    '교육': 'Training',
+})
+# 긴 단어부터 매칭해 '미준수'가 '준수'보다 먼저 치환되도록 함
+_KOREAN_TO_ENGLISH_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(KOREAN_TO_ENGLISH, key=len, reverse=True)))
+)
+
+@functools.lru_cache(maxsize=1)
+def _resolve_korean_font() -> Optional[str]:
+    """
+    사용할 한글 폰트 이름을 찾습니다.
+    폰트 파일 등록(addfont)과 폰트 목록 탐색은 프로세스당 1회만 수행되고,
+    이후 생성되는 서비스 인스턴스는 캐시된 결과를 그대로 사용합니다.
+    
+    Returns:
+        Optional[str]: 한글 폰트 이름 또는 None (찾지 못한 경우)
+    """
+    logger.info("한글 폰트 설정 시작")
+    
+    # 도커 환경에서는 이미 설치된 폰트 사용
+    font_path = None
+    if os.path.exists('/usr/share/fonts/truetype/nanum/NanumGothic.ttf'):
+        font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
+    elif os.path.exists('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'):
+        font_path = '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'
+    elif os.name == 'nt' and os.path.exists('C:/Windows/Fonts/malgun.ttf'):
+        # 윈도우 환경
+        font_path = 'C:/Windows/Fonts/malgun.ttf'
+    
+    if font_path:
+        logger.info(f"한글 폰트 경로 발견: {font_path}")
+        # 폰트 등록
+        font_manager.fontManager.addfont(font_path)
+        font_name = font_manager.FontProperties(fname=font_path).get_name()
+        logger.info(f"한글 폰트 '{font_name}' 설정 완료")
+        return font_name
+    
+    # 설치된 폰트 목록에서 한글 폰트 찾기 (후보 이름과 정확히 일치하는 폰트 우선)
+    installed_names = {font.name for font in font_manager.fontManager.ttflist}
+    font_name = next((name for name in KOREAN_FONT_NAMES if name in installed_names), None)
+    if font_name is None:
+        # 후보 이름을 포함하는 폰트 (예: 'NanumGothic Eco')
+        font_name = next(
+            (font.name for font in font_manager.fontManager.ttflist if _KOREAN_FONT_PATTERN.search(font.name)),
+            None
+        )
+    if font_name:
+        logger.info(f"시스템 폰트에서 한글 폰트 발견: {font_name}")
+        return font_name
+    
+    # 폰트를 찾지 못한 경우 영문 대체 사용
+    logger.warning("한글 폰트를 찾지 못했습니다. 영문 대체 텍스트를 사용합니다.")
+    return None
+
 class VisualizationService:
     """
     회의 내용 시각화 서비스 클래스
@@ -44,11 +245,16 @@ class VisualizationService:
         self.image_dir = os.path.join(os.getcwd(), "static", "visualizations")
         os.makedirs(self.image_dir, exist_ok=True)
         
-        # Seaborn 스타일 설정
-        sns.set(style="whitegrid")
-        
         # 컬러 팔레트 설정 - 현대적이고 세련된 색상
         self.colors = ['#4361EE', '#3A0CA3', '#7209B7', '#F72585', '#4CC9F0', '#4895EF', '#560BAD', '#B5179E', '#F15BB5']
+        self._colors_rgba = matplotlib.colors.to_rgba_array(self.colors)
+        self._gradient_cmap = matplotlib.colormaps['viridis']
+        
+        # 차트 크기/해상도별 재사용 Figure
+        self._figures: Dict[Tuple[Tuple[float, float], int], Figure] = {}
+        
+        # 한글 폰트가 없을 때만 레이블을 영문으로 대체 (폰트 설정 결과에 따라 결정)
+        self._translate_labels = False
         
         # 한글 폰트 설정
         self._setup_korean_font()
@@ -56,135 +262,120 @@ class VisualizationService:
     def _setup_korean_font(self):
         """한글 폰트를 설정합니다."""
         try:
-            logger.info("한글 폰트 설정 시작")
+            font_name = _resolve_korean_font()
             
-            # 기본 폰트 목록 설정
-            font_names = ['NanumGothic', 'Noto Sans CJK KR', 'Malgun Gothic', 'NanumBarunGothic']
-            
-            # 시스템에 설치된 폰트 확인
-            font_found = False
-            
-            # 도커 환경에서는 이미 설치된 폰트 사용
-            if os.path.exists('/usr/share/fonts/truetype/nanum/NanumGothic.ttf'):
-                logger.info("나눔 폰트 경로 발견: /usr/share/fonts/truetype/nanum/NanumGothic.ttf")
-                font_path = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
-                font_found = True
-            elif os.path.exists('/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'):
-                logger.info("Noto CJK 폰트 경로 발견: /usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc")
-                font_path = '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'
-                font_found = True
-            elif os.name == 'nt' and os.path.exists('C:/Windows/Fonts/malgun.ttf'):
-                # 윈도우 환경
-                logger.info("맑은 고딕 폰트 경로 발견: C:/Windows/Fonts/malgun.ttf")
-                font_path = 'C:/Windows/Fonts/malgun.ttf'
-                font_found = True
-                
-            if font_found:
-                # 폰트 등록
-                font_prop = font_manager.FontProperties(fname=font_path)
-                font_manager.fontManager.addfont(font_path)
-                font_name = font_prop.get_name()
-                
+            if font_name:
                 # matplotlib 폰트 설정
                 matplotlib.rcParams['font.family'] = font_name
                 plt.rcParams['font.family'] = font_name
                 matplotlib.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
-                
-                logger.info(f"한글 폰트 '{font_name}' 설정 완료")
             else:
-                # 설치된 폰트 목록에서 한글 폰트 찾기
-                for font in font_manager.fontManager.ttflist:
-                    if any(korean_font in font.name for korean_font in font_names):
-                        logger.info(f"시스템 폰트에서 한글 폰트 발견: {font.name}")
-                        matplotlib.rcParams['font.family'] = font.name
-                        plt.rcParams['font.family'] = font.name
-                        matplotlib.rcParams['axes.unicode_minus'] = False
-                        font_found = True
-                        break
+                # 기본 폰트 사용
+                matplotlib.rcParams['font.family'] = 'sans-serif'
+                plt.rcParams['font.family'] = 'sans-serif'
+                plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial', 'Helvetica']
                 
-                # 폰트를 찾지 못한 경우 영문 대체 사용
-                if not font_found:
-                    logger.warning("한글 폰트를 찾지 못했습니다. 영문 대체 텍스트를 사용합니다.")
-                    # 기본 폰트 사용
-                    matplotlib.rcParams['font.family'] = 'sans-serif'
-                    plt.rcParams['font.family'] = 'sans-serif'
-                    plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial', 'Helvetica']
-                    
-                    # 한글 대체 문자 매핑 설정 (한글 -> 영문)
-                    self.korean_to_english = {
-                        '프로젝트': 'Project',
-                        '연구개발': 'R&D',
-                        '마케팅': 'Marketing',
-                        '인프라': 'Infrastructure',
-                        '인사': 'HR',
-                        '기타': 'Others',
-                        '총계': 'Total',
-                        '구분': 'Category',
-                        '값': 'Value',
-                        '준수': 'Compliance',
-                        '미준수': 'Non-compliance',
-                        '지연': 'Delayed',
-                        '정상': 'Normal',
-                        '현재': 'Now',
-                        '개선': 'Improvement',
-                        '대응': 'Response',
-                        '완료': 'Complete',
-                        '시작': 'Start',
-                        '달성': 'Achieved',
-                        '일정': 'Schedule',
-                        '계획': 'Plan',
-                        '로드맵': 'Roadmap',
-                        '정보보호': 'Security',
-                        '교육': 'Training',
-                    }
+                # 한글 대체 문자 매핑 설정 (한글 -> 영문)
+                self.korean_to_english = KOREAN_TO_ENGLISH
+                self._translate_labels = True
                     
         except Exception as e:
             logger.error(f"한글 폰트 설정 중 오류 발생: {str(e)}")
             # 오류 발생 시 기본 폰트 사용
             matplotlib.rcParams['font.family'] = 'sans-serif'
         
+    def _to_columns(self, data_points: List[MeetingDataPoint]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        데이터 포인트 목록을 레이블/값/카테고리 열 배열로 한 번에 변환합니다.
+        
+        Args:
+            data_points (List[MeetingDataPoint]): 데이터 포인트 목록
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: 레이블(번역 적용), 값, 카테고리(번역 적용, 없으면 빈 문자열)
+        """
+        count = len(data_points)
+        labels = np.empty(count, dtype=object)
+        categories = np.empty(count, dtype=object)
+        for i, point in enumerate(data_points):
+            labels[i] = self._translate_korean(point.label)
+            categories[i] = self._translate_korean(point.category) if point.category else ''
+        values = np.array([point.value for point in data_points])
+        return labels, values, categories
+    
+    def _get_figure(self, figsize: Tuple[float, float], dpi: int) -> Figure:
+        """
+        크기/해상도별로 재사용하는 빈 Figure를 반환합니다.
+        렌더링마다 캔버스를 새로 할당하지 않도록 pyplot을 거치지 않고 만든 Figure를 비워서 다시 씁니다.
+        (렌더링은 프로세스당 한 번에 하나씩 실행되므로 별도 잠금은 두지 않습니다.)
+        
+        Args:
+            figsize (Tuple[float, float]): 그림 크기 (인치)
+            dpi (int): 해상도
+            
+        Returns:
+            Figure: 비어 있는 matplotlib Figure
+        """
+        key = (figsize, dpi)
+        fig = self._figures.get(key)
+        if fig is None:
+            fig = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(fig)
+            self._figures[key] = fig
+        else:
+            fig.clear()
+        fig.set_facecolor('white')
+        return fig
+    
     def _translate_korean(self, text):
         """
         한글 폰트가 없는 경우 한글 텍스트를 영문으로 대체합니다.
         """
         # 폰트가 제대로 설정되었으면 원본 반환
-        if plt.rcParams['font.family'] not in ['DejaVu Sans', 'sans-serif']:
+        if not self._translate_labels:
             return text
             
-        # 한글 대체
-        for kr, en in self.korean_to_english.items():
-            text = text.replace(kr, en)
-        return text
+        # 한글 대체 (모든 대체어를 한 번의 스캔으로 치환)
+        return _KOREAN_TO_ENGLISH_PATTERN.sub(lambda match: self.korean_to_english[match.group(0)], text)
         
-    def _save_image_to_file(self, img_data_uri: str) -> str:
+    def _save_image_to_file(self, image: Union[bytes, str]) -> str:
         """
-        Base64 인코딩된 이미지를 파일로 저장하고 URL을 반환합니다.
+        이미지를 파일로 저장하고 URL을 반환합니다.
         
         Args:
-            img_data_uri (str): Base64 인코딩된 이미지 데이터 URI
+            image (Union[bytes, str]): PNG 바이트 또는 Base64 인코딩된 이미지 데이터 URI
             
         Returns:
             str: 저장된 이미지의 URL
         """
         try:
-            # 데이터 URI에서 Base64 부분 추출
-            if "base64," in img_data_uri:
-                b64_str = img_data_uri.split("base64,")[1]
+            if isinstance(image, (bytes, bytearray, memoryview)):
+                # 렌더러가 만든 PNG 바이트는 그대로 저장
+                img_bytes = image
             else:
-                b64_str = img_data_uri
-                
-            # Base64 디코딩
-            img_bytes = base64.b64decode(b64_str)
+                # 데이터 URI에서 Base64 부분 추출
+                if "base64," in image:
+                    b64_str = image.split("base64,")[1]
+                else:
+                    b64_str = image
+                    
+                # Base64 디코딩
+                img_bytes = pybase64.b64decode(b64_str)
             
             # 파일명 생성 (타임스탬프 + 랜덤 문자열)
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+            random_str = secrets.token_hex(4)
             filename = f"viz_{timestamp}_{random_str}.png"
             
-            # 파일 저장
+            # 파일 저장 (버퍼링 계층을 거치지 않고 파일 디스크립터에 직접 기록)
             filepath = os.path.join(self.image_dir, filename)
-            with open(filepath, "wb") as f:
-                f.write(img_bytes)
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(img_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
                 
             # URL 생성 (/static/ 접두어 사용)
             img_url = f"/static/visualizations/{filename}"
@@ -214,98 +405,42 @@ class VisualizationService:
         """
         logger.info(f"쿼리 '{query}'에 대한 데이터 추출 시작")
         
-        # 정확한 시각화 요청 매칭
+        # 정확한 시각화 요청 매칭 (쿼리를 한 번만 훑어 포함된 키워드 집합을 구함)
         query_lower = query.lower().strip()
+        keywords = set(_MEETING_KEYWORD_PATTERN.findall(query_lower))
         
         # 1. "미갱신 고객 비율을 차트로 보여줘" - 파이 차트
-        if "미갱신 고객 비율" in query_lower or (
-            "미갱신" in query_lower and "고객" in query_lower and "비율" in query_lower
-        ):
+        if {"미갱신", "고객", "비율"} <= keywords:
             logger.info("미갱신 고객 비율 시각화 요청 감지: 파이 차트 생성")
-            data_points = [
-                MeetingDataPoint(label="1년 이상 미갱신", value=120000, category="미준수"),
-                MeetingDataPoint(label="정상 갱신", value=400000, category="준수")
-            ]
-            chart_type = ChartType.PIE
-            title = "고객 KYC 갱신 현황"
-            return data_points, chart_type, title
+            return _meeting_data("kyc_pie")
             
         # 2. "STR 지연 건에 대한 그래프를 생성해줘" - 막대 차트
-        elif "str 지연" in query_lower or (
-            "str" in query_lower and ("지연" in query_lower or "보고" in query_lower)
-        ):
+        elif "str" in keywords and not keywords.isdisjoint(("지연", "보고")):
             logger.info("STR 지연 건 시각화 요청 감지: 막대 차트 생성")
-            data_points = [
-                MeetingDataPoint(label="정상 보고", value=93, category="준수"),
-                MeetingDataPoint(label="일반 거래 지연", value=5, category="경미한 지연"),
-                MeetingDataPoint(label="고위험 거래 지연", value=2, category="중대한 지연")
-            ]
-            chart_type = ChartType.BAR
-            title = "STR 보고 준수 현황 (최근 6개월)"
-            return data_points, chart_type, title
+            return _meeting_data("str_bar")
             
         # 3. "규제 준수 일정을 타임라인으로 보여줘" - 타임라인 차트
-        elif ("규제 준수 일정" in query_lower or "규제 준수 로드맵" in query_lower) or (
-            "규제" in query_lower and "준수" in query_lower and 
-            ("일정" in query_lower or "로드맵" in query_lower or "타임라인" in query_lower)
-        ):
+        elif {"규제", "준수"} <= keywords and not keywords.isdisjoint(("일정", "로드맵", "타임라인")):
             logger.info("규제 준수 일정 시각화 요청 감지: 타임라인 차트 생성")
-            today = datetime.now()
-            data_points = [
-                MeetingDataPoint(label="KYC 알림 메일 발송", value=1, timestamp="2023-04-10", category="KYC 개선"),
-                MeetingDataPoint(label="셀프 KYC 메뉴 배포", value=2, timestamp="2023-04-17", category="KYC 개선"),
-                MeetingDataPoint(label="KYC 70% 달성", value=3, timestamp="2023-04-30", category="KYC 개선"),
-                MeetingDataPoint(label="STR 72시간 규정 시행", value=2, timestamp="2023-04-07", category="STR 개선"),
-                MeetingDataPoint(label="정보보호 교육 시작", value=2, timestamp="2023-04-18", category="정보보호"),
-                MeetingDataPoint(label="암호화 업데이트 완료", value=3, timestamp="2023-05-15", category="정보보호"),
-                MeetingDataPoint(label="스크러빙 센터 계약", value=2, timestamp="2023-04-30", category="DDoS 대응"),
-                MeetingDataPoint(label="AI 트래픽 탐지 PoC", value=3, timestamp="2023-05-15", category="DDoS 대응"),
-                MeetingDataPoint(label="모의훈련 실시", value=2, timestamp="2023-05-25", category="DDoS 대응"),
-                MeetingDataPoint(label="KYC 100% 완료", value=4, timestamp="2023-06-30", category="최종 목표"),
-                MeetingDataPoint(label="DDoS 방어체계 구축", value=4, timestamp="2023-05-31", category="최종 목표")
-            ]
-            chart_type = ChartType.TIMELINE
-            title = "금융 규제 준수 개선 로드맵"
-            return data_points, chart_type, title
+            return _meeting_data("compliance_timeline")
         
         # 4. 보안/정보보호 관련 요청
-        elif "보안" in query_lower or "정보보호" in query_lower or "ddos" in query_lower:
+        elif not keywords.isdisjoint(("보안", "정보보호", "ddos")):
             logger.info("보안/정보보호 이슈 시각화 요청 감지: 막대 차트 생성")
-            data_points = [
-                MeetingDataPoint(label="로그 점검 미흡", value=4, category="마이데이터"),
-                MeetingDataPoint(label="구형 암호화 알고리즘", value=3, category="시스템"),
-                MeetingDataPoint(label="정보보호 교육 부족", value=2, category="인력"),
-                MeetingDataPoint(label="DDoS 방어 취약", value=5, category="네트워크")
-            ]
-            chart_type = ChartType.BAR
-            title = "정보보호 취약점 심각도 평가"
-            return data_points, chart_type, title
+            return _meeting_data("security_bar")
             
         # 5. KYC 관련 요청이지만 비율이 아닌 다른 정보
-        elif "kyc" in query_lower or "고객" in query_lower:
+        elif not keywords.isdisjoint(("kyc", "고객")):
             logger.info("KYC 관련 시각화 요청 감지: 파이 차트 생성")
-            data_points = [
-                MeetingDataPoint(label="1년 이상 미갱신", value=120000, category="미준수"),
-                MeetingDataPoint(label="정상 갱신", value=400000, category="준수")
-            ]
-            chart_type = ChartType.PIE
-            title = "고객 KYC 갱신 현황"
-            return data_points, chart_type, title
+            return _meeting_data("kyc_pie")
         
         # 6. 그 외 기본 요약 정보 (문서에서 내용 추출하여 사용 가능)
         else:
             logger.info("일반 시각화 요청: 기본 미준수 사항 요약 생성")
-            data_points = [
-                MeetingDataPoint(label="KYC 재확인 누락", value=12, category="고객확인"),
-                MeetingDataPoint(label="STR 보고 지연", value=7, category="의심거래"),
-                MeetingDataPoint(label="거래모니터링 주기 완화", value=4, category="모니터링"),
-                MeetingDataPoint(label="정보보호 점검 미흡", value=5, category="정보보호"),
-                MeetingDataPoint(label="DDoS 대응 미비", value=4, category="보안")
-            ]
+            data_points, _, title = _meeting_data("summary")
             
             # 차트 유형은 쿼리에서 결정 (기본값: 막대 차트)
             chart_type = self._determine_chart_type(query)
-            title = "금융 규제 미준수 사항 현황"
             return data_points, chart_type, title
     
     def _determine_chart_type(self, query: str) -> ChartType:
@@ -318,18 +453,11 @@ class VisualizationService:
         Returns:
             ChartType: 결정된 차트 유형
         """
-        query_lower = query.lower()
-        
-        if "파이" in query_lower or "원형" in query_lower or "비율" in query_lower:
-            return ChartType.PIE
-        elif "막대" in query_lower or "바" in query_lower or "비교" in query_lower:
-            return ChartType.BAR
-        elif "선" in query_lower or "추세" in query_lower or "변화" in query_lower or "시간" in query_lower:
-            return ChartType.LINE
-        elif "산점도" in query_lower or "분포" in query_lower:
-            return ChartType.SCATTER
-        elif "타임라인" in query_lower or "일정" in query_lower:
-            return ChartType.TIMELINE
+        # 쿼리에 등장한 차트 유형을 한 번에 찾은 뒤 우선순위(파이 > 막대 > 선 > 산점도 > 타임라인)로 선택
+        found = {match.lastgroup for match in _CHART_KEYWORD_PATTERN.finditer(query.lower())}
+        for chart_type in _CHART_TYPE_PRIORITY:
+            if chart_type.value in found:
+                return chart_type
         
         # 기본값
         return ChartType.BAR
@@ -356,25 +484,71 @@ class VisualizationService:
         """
         logger.info(f"시각화 생성 시작: {len(data_points)}개 데이터 포인트, 차트 유형: {chart_type}, 제목: '{title}'")
         
-        # 차트 유형에 따라 적절한 시각화 함수 호출
-        if chart_type == ChartType.PIE:
-            fig, chart_data = self._create_pie_chart(data_points, title)
-        elif chart_type == ChartType.BAR:
-            fig, chart_data = self._create_bar_chart(data_points, title)
-        elif chart_type == ChartType.LINE:
-            fig, chart_data = self._create_line_chart(data_points, title)
-        elif chart_type == ChartType.SCATTER:
-            fig, chart_data = self._create_scatter_chart(data_points, title)
-        elif chart_type == ChartType.TIMELINE:
-            fig, chart_data = self._create_timeline_chart(data_points, title)
+        # 같은 데이터로 이미 그린 차트는 다시 렌더링하지 않음
+        # (산점도는 x 좌표를 무작위로 생성하므로 캐시하면 같은 배치가 고정됨)
+        cache_key = None
+        cached = None
+        if chart_type not in _UNCACHED_CHART_TYPES:
+            cache_key = _render_cache_key(data_points, chart_type, title)
+            with _render_cache_lock:
+                cached = _render_cache.get(cache_key)
+        if cached is not None:
+            img_data_uri, chart_data = cached
+            logger.info("시각화 캐시 적중: 렌더링 생략")
+            return img_data_uri, dict(chart_data)
+        
+        if CHART_RENDER_MAX_WORKERS == 0:
+            img_data_uri, chart_data = self._render_visualization(data_points, chart_type, title)
         else:
-            logger.warning(f"지원되지 않는 차트 유형: {chart_type}, 기본 막대 차트로 대체")
-            fig, chart_data = self._create_bar_chart(data_points, title)
+            # 렌더링(matplotlib + savefig)이 이벤트 루프를 막지 않도록 렌더링 프로세스에서 실행
+            loop = asyncio.get_running_loop()
+            img_data_uri, chart_data = await loop.run_in_executor(
+                _get_render_pool(), _render_in_worker, data_points, chart_type, title
+            )
         
-        # matplotlib 그림 객체를 base64 인코딩 이미지로 변환
-        img_data_uri = self._fig_to_base64(fig)
+        if cache_key is not None:
+            with _render_cache_lock:
+                _render_cache[cache_key] = (img_data_uri, chart_data)
         
         logger.info(f"시각화 생성 완료: base64 인코딩된 이미지 생성됨")
+        return img_data_uri, dict(chart_data)
+    
+    def _render_visualization(
+        self,
+        data_points: List[MeetingDataPoint],
+        chart_type: ChartType,
+        title: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        차트를 그리고 base64 인코딩된 이미지로 변환합니다. (동기 함수)
+        
+        Args:
+            data_points (List[MeetingDataPoint]): 데이터 포인트 목록
+            chart_type (ChartType): 차트 유형
+            title (str): 차트 제목
+            
+        Returns:
+            Tuple[str, Dict[str, Any]]: base64 인코딩된 이미지 데이터, 차트 데이터
+        """
+        # 차트 유형별 스타일은 그리기/저장 구간에만 적용 (전역 rcParams를 바꾸지 않음)
+        with matplotlib.rc_context(_CHART_STYLES.get(chart_type)):
+            # 차트 유형에 따라 적절한 시각화 함수 호출
+            if chart_type == ChartType.PIE:
+                fig, chart_data = self._create_pie_chart(data_points, title)
+            elif chart_type == ChartType.BAR:
+                fig, chart_data = self._create_bar_chart(data_points, title)
+            elif chart_type == ChartType.LINE:
+                fig, chart_data = self._create_line_chart(data_points, title)
+            elif chart_type == ChartType.SCATTER:
+                fig, chart_data = self._create_scatter_chart(data_points, title)
+            elif chart_type == ChartType.TIMELINE:
+                fig, chart_data = self._create_timeline_chart(data_points, title)
+            else:
+                logger.warning(f"지원되지 않는 차트 유형: {chart_type}, 기본 막대 차트로 대체")
+                fig, chart_data = self._create_bar_chart(data_points, title)
+        
+            # matplotlib 그림 객체를 base64 인코딩 이미지로 변환
+            img_data_uri = self._fig_to_base64(fig)
         return img_data_uri, chart_data
     
     def _create_pie_chart(
@@ -393,31 +567,25 @@ class VisualizationService:
             Tuple[Any, Dict[str, Any]]: 차트 객체와 차트 데이터
         """
         # 데이터 준비
-        labels = [self._translate_korean(point.label) for point in data_points]
-        values = [point.value for point in data_points]
-        categories = [self._translate_korean(point.category) for point in data_points if point.category]
+        labels, values, _ = self._to_columns(data_points)
         
         # 퍼센트 계산
-        total = sum(values)
-        percentages = [value/total*100 for value in values]
-        
-        # 플롯 스타일 설정
-        plt.style.use('seaborn-v0_8-pastel')
+        total = values.sum()
+        percentages = values / total * 100
         
         # 더 세련된 색상 팔레트
         colors = ['#4361ee', '#3a0ca3', '#7209b7', '#f72585', '#4cc9f0', 
                   '#480ca8', '#b5179e', '#560bad', '#4895ef', '#ff9f1c']
               
         # 그림 크기 및 해상도 설정
-        plt.figure(figsize=(12, 9), dpi=120, facecolor='white')
+        fig = self._get_figure((12, 9), 120)
         
         # 원형 차트 설정
-        ax = plt.subplot(111)
+        ax = fig.add_subplot(111)
         ax.set_facecolor('#ffffff')  # 배경색 흰색
         
         # 데이터 크기에 따라 돌출 효과 적용 (강조)
-        max_index = values.index(max(values))
-        explode = [0.05 if i == max_index else 0 for i in range(len(values))]
+        explode = np.where(np.arange(len(values)) == values.argmax(), 0.05, 0)
         
         # 도넛 차트 생성 - 더 세련된 스타일
         wedges, texts, autotexts = ax.pie(
@@ -501,17 +669,17 @@ class VisualizationService:
         plt.setp(legend.get_title(), fontweight='bold')
         
         # 차트 레이아웃 조정
-        plt.tight_layout(pad=3.0)
+        fig.tight_layout(pad=3.0)
         
         # 차트 데이터 반환
         chart_data = {
             "labels": [point.label for point in data_points],  # 원본 한글 레이블 유지
-            "values": values,
-            "percentages": percentages,
+            "values": values.tolist(),
+            "percentages": percentages.tolist(),
             "categories": [point.category for point in data_points if point.category]  # 원본 한글 카테고리 유지
         }
         
-        return plt.gcf(), chart_data
+        return fig, chart_data
     
     def _create_bar_chart(
         self, 
@@ -529,37 +697,37 @@ class VisualizationService:
             Tuple[Any, Dict[str, Any]]: 차트 객체와 차트 데이터
         """
         # 데이터 준비
-        labels = [self._translate_korean(point.label) for point in data_points]
-        values = [point.value for point in data_points]
-        categories = [self._translate_korean(point.category) for point in data_points if point.category]
-        
-        # 값으로 정렬
-        if len(data_points) > 1:
-            sorted_indices = np.argsort(values)[::-1]  # 내림차순 정렬
-            labels = [labels[i] for i in sorted_indices]
-            values = [values[i] for i in sorted_indices]
-            if categories:
-                categories = [categories[i] for i in sorted_indices]
+        labels, values, categories = self._to_columns(data_points)
+        
+        # 값으로 정렬 (내림차순, 모든 열을 같은 순서로 한 번에 재배열)
+        order = np.arange(len(data_points))
+        if len(data_points) > BAR_CHART_MAX_BARS:
+            # 막대가 너무 많으면 읽을 수 있는 상위 항목만 선택한 뒤 그 안에서만 정렬
+            top = np.argpartition(-values, BAR_CHART_MAX_BARS - 1)[:BAR_CHART_MAX_BARS]
+            order = top[np.argsort(-values[top], kind='stable')]
+            labels, values, categories = labels[order], values[order], categories[order]
+        elif len(data_points) > 1:
+            order = np.argsort(-values, kind='stable')
+            labels, values, categories = labels[order], values[order], categories[order]
         
         # 색상 설정
-        if categories and len(set(categories)) > 1:
-            # 카테고리별 색상 적용
-            unique_categories = list(set(categories))
-            category_colors = {cat: self.colors[i % len(self.colors)] for i, cat in enumerate(unique_categories)}
-            colors = [category_colors[cat] for cat in categories]
+        unique_categories, category_index = np.unique(categories, return_inverse=True)
+        named = unique_categories != ''
+        use_category_colors = np.count_nonzero(named) > 1
+        if use_category_colors:
+            # 카테고리별 색상 적용 (카테고리 인덱스로 팔레트를 한 번에 조회)
+            category_palette = self._colors_rgba[np.arange(len(unique_categories)) % len(self._colors_rgba)]
+            colors = category_palette[category_index]
         else:
             # 그라데이션 색상 적용
-            import matplotlib.cm as cm
-            cmap = cm.get_cmap('viridis')
-            colors = [cmap(i/len(data_points)) for i in range(len(data_points))]
+            colors = self._gradient_cmap(np.arange(len(values)) / len(values))
         
         # 그림 생성
-        plt.figure(figsize=(12, 8), dpi=100, facecolor='white')
-        plt.style.use('seaborn-v0_8-whitegrid')
-        ax = plt.subplot(111)
+        fig = self._get_figure((12, 8), 100)
+        ax = fig.add_subplot(111)
         
         # 막대 그래프 생성 - 수평 방향이 긴 레이블에 더 적합
-        horizontal = max([len(label) for label in labels]) > 8
+        horizontal = max(len(label) for label in labels) > 8
         
         if horizontal:
             # 수평 막대 그래프
@@ -633,11 +801,11 @@ class VisualizationService:
         
         # 배경 설정
         ax.set_facecolor('#f8f9fa')
-        plt.gcf().set_facecolor('#ffffff')
+        fig.set_facecolor('#ffffff')
         
         # x축 레이블 회전 (레이블이 긴 경우)
-        if not horizontal and max([len(str(label)) for label in labels]) > 5:
-            plt.xticks(rotation=45, ha='right')
+        if not horizontal and max(len(str(label)) for label in labels) > 5:
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # 격자 스타일 설정
         ax.grid(axis=('x' if horizontal else 'y'), linestyle='--', alpha=0.6, color='#cccccc')
@@ -647,13 +815,12 @@ class VisualizationService:
             spine.set_visible(False)
         
         # 범례 설정 (카테고리가 있는 경우)
-        if categories and len(set(categories)) > 1:
+        if use_category_colors:
             # 카테고리별 색상으로 범례 생성
-            unique_categories = list(set(categories))
-            legend_handles = [plt.Rectangle((0,0),1,1, color=category_colors[cat], alpha=0.8) for cat in unique_categories]
+            legend_handles = [plt.Rectangle((0,0),1,1, color=color, alpha=0.8) for color in category_palette[named]]
             ax.legend(
                 legend_handles, 
-                unique_categories, 
+                list(unique_categories[named]), 
                 loc='upper right',
                 frameon=True,
                 framealpha=0.7,
@@ -661,16 +828,18 @@ class VisualizationService:
             )
         
         # 차트 레이아웃 조정
-        plt.tight_layout()
+        fig.tight_layout()
         
         # 차트 데이터 반환
+        # 그려진 막대와 같은 순서/개수로 원본 한글 레이블과 카테고리를 유지
+        shown_points = [data_points[i] for i in order]
         chart_data = {
-            "labels": [point.label for point in data_points],  # 원본 한글 레이블 유지
-            "values": values,
-            "categories": [point.category for point in data_points if point.category]  # 원본 한글 카테고리 유지
+            "labels": [point.label for point in shown_points],
+            "values": values.tolist(),
+            "categories": [point.category for point in shown_points if point.category]
         }
         
-        return plt.gcf(), chart_data
+        return fig, chart_data
     
     def _create_line_chart(
         self, 
@@ -685,24 +854,24 @@ class VisualizationService:
             title (str): 차트 제목
         
         Returns:
-            Tuple[Any, Dict[str, Any]]: Plotly 그림 객체와 데이터
+            Tuple[Any, Dict[str, Any]]: 차트 객체와 차트 데이터
         """
         labels = [point.label for point in data_points]
         values = [point.value for point in data_points]
         
-        fig = px.line(
-            x=labels,
-            y=values,
-            title=title,
-            labels={"x": "시간/단계", "y": "값"},
-            markers=True
-        )
+        fig = self._get_figure((12, 8), 100)
+        ax = fig.add_subplot(111)
         
-        fig.update_layout(
-            xaxis_title="시간/단계",
-            yaxis_title="값",
-            font=dict(size=14),
-        )
+        ax.plot(labels, values, marker='o', color=self.colors[0], linewidth=2, markersize=8)
+        
+        ax.set_title(self._translate_korean(title), fontsize=18, fontweight='bold', color='#333333', pad=20)
+        ax.set_xlabel(self._translate_korean("시간/단계"), fontsize=14)
+        ax.set_ylabel(self._translate_korean("값"), fontsize=14)
+        ax.tick_params(labelsize=12)
+        if max((len(str(label)) for label in labels), default=0) > 5:
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        
+        fig.tight_layout()
         
         data = {
             "x": labels,
@@ -724,31 +893,33 @@ class VisualizationService:
             title (str): 차트 제목
         
         Returns:
-            Tuple[Any, Dict[str, Any]]: Plotly 그림 객체와 데이터
+            Tuple[Any, Dict[str, Any]]: 차트 객체와 차트 데이터
         """
         # 실제 구현에서는 2차원 데이터가 필요하므로 예시 데이터 생성
         x_values = np.random.normal(0, 1, len(data_points))
         y_values = [point.value for point in data_points]
         labels = [point.label for point in data_points]
         
-        fig = px.scatter(
-            x=x_values,
-            y=y_values,
-            text=labels,
-            title=title,
-            labels={"x": "X 축", "y": "Y 축"}
-        )
+        fig = self._get_figure((12, 8), 100)
+        ax = fig.add_subplot(111)
         
-        fig.update_traces(
-            textposition="top center",
-            marker=dict(size=12)
-        )
+        ax.scatter(x_values, y_values, s=144, color=self.colors[0], zorder=2)
+        for x, y, label in zip(x_values, y_values, labels):
+            ax.annotate(
+                self._translate_korean(label),
+                (x, y),
+                xytext=(0, 10),
+                textcoords='offset points',
+                ha='center',
+                va='bottom',
+                fontsize=12
+            )
         
-        fig.update_layout(
-            xaxis_title="X 축",
-            yaxis_title="Y 축",
-            font=dict(size=14),
-        )
+        ax.set_title(self._translate_korean(title), fontsize=18, fontweight='bold', color='#333333', pad=20)
+        ax.set_xlabel(self._translate_korean("X 축"), fontsize=14)
+        ax.set_ylabel(self._translate_korean("Y 축"), fontsize=14)
+        
+        fig.tight_layout()
         
         data = {
             "x": x_values.tolist(),
@@ -810,32 +981,26 @@ class VisualizationService:
             category_colors[cat] = cmap(i % 10)
         
         # 플롯 생성
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig = self._get_figure((14, 8), 100)
+        ax = fig.add_subplot(111)
         
-        # 각 이벤트 플롯
-        for i, event in enumerate(events):
-            # 색상 결정
-            if event["category"] in category_colors:
-                color = category_colors[event["category"]]
-            else:
-                color = cmap(len(categories) % 10)
-            
-            # 마커 크기 결정 (중요도/값에 따라)
-            size = 100 + (event["value"] * 50 if event["value"] else 100)
-            
-            # 마커 표시
+        # 이벤트 마커를 한 번에 플롯 (이벤트 순서대로 y 위치 0..N-1)
+        if events:
+            other_color = cmap(len(categories) % 10)
             ax.scatter(
-                event["date"], 
-                i, 
-                s=size, 
-                color=color,
+                [event["date"] for event in events],
+                np.arange(len(events)),
+                # 마커 크기 결정 (중요도/값에 따라)
+                s=[100 + (event["value"] * 50 if event["value"] else 100) for event in events],
+                color=[category_colors.get(event["category"], other_color) for event in events],
                 alpha=0.7,
                 edgecolors='white',
                 linewidth=1.5,
                 zorder=2
             )
-            
-            # 이벤트 레이블 표시
+        
+        # 이벤트 레이블 표시
+        for i, event in enumerate(events):
             ax.annotate(
                 event["label"],
                 (event["date"], i),
@@ -843,7 +1008,7 @@ class VisualizationService:
                 textcoords='offset points',
                 fontsize=11,
                 va='center',
-                bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8)
+                bbox=_TIMELINE_LABEL_BBOX
             )
         
         # y축 눈금 제거
@@ -851,7 +1016,7 @@ class VisualizationService:
         
         # x축 날짜 포맷 설정
         ax.xaxis.set_major_formatter(matplotlib.dates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
+        plt.setp(ax.get_xticklabels(), rotation=45)
         
         # 그리드 추가
         ax.grid(axis='x', linestyle='--', alpha=0.3)
@@ -869,7 +1034,7 @@ class VisualizationService:
                      ncol=min(len(categories), 4), frameon=True)
         
         # 레이아웃 조정
-        plt.tight_layout()
+        fig.tight_layout()
         
         # 데이터 반환
         chart_data = {
@@ -884,7 +1049,7 @@ class VisualizationService:
             "categories": categories
         }
         
-        return plt.gcf(), chart_data
+        return fig, chart_data
     
     def _generate_thinking_process(self, chart_type: str, data: Dict[str, Any], title: str) -> List[str]:
         """
@@ -1170,6 +1335,18 @@ class VisualizationService:
         Raises:
             Exception: 이미지 변환 중 오류가 발생한 경우
         """
+        return self._png_bytes_to_data_uri(self._fig_to_png_bytes(fig))
+    
+    def _fig_to_png_bytes(self, fig) -> bytes:
+        """
+        matplotlib 그림 객체를 PNG 바이트로 변환합니다.
+        
+        Args:
+            fig: matplotlib 그림 객체
+            
+        Returns:
+            bytes: PNG 이미지 데이터
+        """
         # 이미지를 바이트 스트림으로 저장
         img_data = io.BytesIO()
         fig.savefig(
@@ -1178,15 +1355,68 @@ class VisualizationService:
             bbox_inches='tight', 
             dpi=100, 
             facecolor=fig.get_facecolor(),
-            edgecolor='none'
+            edgecolor='none',
+            pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL}
         )
-        img_data.seek(0)
-        
-        # base64로 인코딩
-        encoded = base64.b64encode(img_data.read()).decode('utf-8')
-        img_data_uri = f"data:image/png;base64,{encoded}"
         
-        # 메모리 정리
-        plt.close(fig)
+        return img_data.getvalue()
+    
+    @staticmethod
+    def _png_bytes_to_data_uri(png_bytes: bytes) -> str:
+        """
+        PNG 바이트를 base64 데이터 URI로 변환합니다. (클라이언트에 인라인 이미지로 보낼 때만 사용)
         
-        return img_data_uri 
\ No newline at end of file
+        Args:
+            png_bytes (bytes): PNG 이미지 데이터
+            
+        Returns:
+            str: base64 인코딩된 이미지 데이터 URI
+        """
+        return f"data:image/png;base64,{pybase64.b64encode_as_string(png_bytes)}"
+
+
+def _render_cache_key(data_points: List[MeetingDataPoint], chart_type: ChartType, title: str) -> Tuple:
+    """렌더링 결과 캐시 키를 만듭니다. (차트 모양에 영향을 주는 필드만 사용)"""
+    return (
+        chart_type,
+        title,
+        tuple((point.label, point.value, point.timestamp, point.category) for point in data_points),
+    )
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """차트 렌더링 프로세스 풀을 반환합니다. 최초 호출 시 1회만 생성합니다."""
+    global _render_pool
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                _render_pool = ProcessPoolExecutor(
+                    max_workers=CHART_RENDER_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context(CHART_RENDER_START_METHOD)
+                )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """차트 렌더링 프로세스 풀을 종료합니다. (애플리케이션 종료 시 호출)"""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("차트 렌더링 프로세스 풀 종료")
+
+
+# 렌더링 프로세스 안에서 재사용하는 서비스 인스턴스 (폰트/스타일 설정을 프로세스당 1회만 수행)
+_worker_service: Optional[VisualizationService] = None
+
+def _render_in_worker(
+    data_points: List[MeetingDataPoint],
+    chart_type: ChartType,
+    title: str
+) -> Tuple[str, Dict[str, Any]]:
+    """렌더링 프로세스에서 차트를 그립니다. (프로세스 풀로 전달되므로 모듈 수준 함수로 정의)"""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = VisualizationService()
+    return _worker_service._render_visualization(data_points, chart_type, title)
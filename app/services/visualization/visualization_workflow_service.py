@@ -433,7 +433,7 @@ The visualization explanation will reference the overall remediation timeline di
 """
         else:
             # 기본 사고 과정
-            return await self.thinking_service.generate_thinking(
+            return self.thinking_service.generate_thinking_sync(
                 f"Visualization request: {query}. Let's think about what type of chart would be appropriate and what data to display."
             )
     
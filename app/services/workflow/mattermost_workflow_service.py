@@ -2,6 +2,7 @@
 Mattermost 워크플로우 서비스 모듈
 Mattermost 관련 작업 처리를 담당하는 워크플로우 서비스를 제공합니다.
 """
+import asyncio
 import logging
 import os
 from typing import Dict, List, Any, Optional, AsyncGenerator
@@ -214,7 +215,7 @@ class MattermostWorkflowService:
                         
                         # 매핑이 없을 경우 Mattermost API로 검색 시도
                         if not mattermost_id:
-                            user_result = self.mm_service.find_mattermost_user_id(participant_name)
+                            user_result = await self.mm_service.find_mattermost_user_id_async(participant_name)
                             if user_result and user_result.get("success", False):
                                 mattermost_id = user_result.get("user_id")
                         
@@ -244,7 +245,7 @@ class MattermostWorkflowService:
                                 while retry_count < max_retries and not success:
                                     try:
                                         # 회의록 메시지 전송
-                                        result = self.mm_service.send_message_to_user(
+                                        result = await self.mm_service.send_message_to_user_async(
                                             user_id=mattermost_id,
                                             message=message
                                         )
@@ -263,8 +264,7 @@ class MattermostWorkflowService:
                                         
                                         # 마지막 시도가 아니면 잠시 대기 후 재시도
                                         if retry_count < max_retries:
-                                            import time
-                                            time.sleep(1)  # 1초 대기
+                                            await asyncio.sleep(1)  # 1초 대기
                                 
                                 # 모든 시도 실패
                                 if not success:
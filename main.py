@@ -6,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware # CORS 미들웨어 임포트
 from app.routers import chat as chat_router # chat 라우터 import
 from app.core.config import settings # 설정 import (prefix 등에 활용 가능)
 from app.services.workflow.workflow_manager import workflow_manager # workflow_manager 임포트
+from app.services.mattermost.mattermost_core import install_dns_cache # Mattermost DNS 캐시 설치
+from app.services.mattermost.mattermost_manager import get_manager # Mattermost 관리자 (시작 시 연결 예열)
 from contextlib import asynccontextmanager # asynccontextmanager 임포트
 from fastapi.staticfiles import StaticFiles # 정적 파일 제공을 위한 임포트
 
@@ -34,16 +36,6 @@ async def lifespan(app: FastAPI):
         module_logger = logging.getLogger(logger_name)
         module_logger.setLevel(logging.DEBUG)
     
-    # 플로틀리 및 kaleido 관련 로그 레벨 설정
-    plotly_loggers = [
-        "plotly", 
-        "kaleido"
-    ]
-    
-    for logger_name in plotly_loggers:
-        plotly_logger = logging.getLogger(logger_name)
-        plotly_logger.setLevel(logging.DEBUG)
-    
     logger = logging.getLogger(__name__) # logger 인스턴스 생성
     
     # 시스템 환경 정보 로깅
@@ -61,6 +53,12 @@ async def lifespan(app: FastAPI):
     logger.info(f"정적 파일 디렉토리 확인: {static_dir} (존재: {os.path.exists(static_dir)})")
     logger.info(f"시각화 디렉토리 확인: {visualization_dir} (존재: {os.path.exists(visualization_dir)})")
 
+    # Mattermost 호스트 DNS 조회 캐시 설치 (임포트 부작용이 아닌 시작 시점에 명시적으로 적용)
+    install_dns_cache()
+    
+    # Mattermost 관리자 생성 및 백그라운드 연결 예열 (프로세스당 한 번, 시작을 막지 않음)
+    get_manager()
+    
     logger.info("애플리케이션 시작 - DB 초기화 시도 직전 (main.py lifespan)")
     db_init_success = await workflow_manager.async_initialize_db()
     if db_init_success:
@@ -70,6 +68,9 @@ async def lifespan(app: FastAPI):
     logger.info("DB 초기화 로직 완료 후 (main.py lifespan)")
     yield
     # 애플리케이션 종료 시 실행 (필요한 경우)
+    # 차트 렌더링 프로세스 풀 종료 (matplotlib 로딩을 시작 시점으로 앞당기지 않도록 지연 임포트)
+    from app.services.visualization.visualization_service import shutdown_render_pool
+    shutdown_render_pool()
     logger.info("애플리케이션 종료 (main.py lifespan)")
 
 app = FastAPI(